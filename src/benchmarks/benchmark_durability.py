@@ -0,0 +1,120 @@
+# -----------------------------------------------------------------------------
+# Structra - A tool to generate folder and file structures based on input text files
+#
+# Copyright (c) 2024 Jonas Zeihe
+# Licensed under the MIT License. See LICENSE file in the project root for details.
+#
+# Project URL: https://github.com/jonaszeihe/structra
+# Contact: JonasZeihe@gmail.com
+# -----------------------------------------------------------------------------
+
+# benchmark_durability.py
+
+"""
+Measures the generation throughput of every durability level.
+
+Run from the src folder, optionally pointing --target at the storage to measure:
+
+    python -m benchmarks.benchmark_durability --dirs 100 --files 100 --runs 5
+
+The runs of the levels are interleaved, and the median, minimum and maximum
+duration of every level is reported.
+
+Author: Jonas Zeihe
+"""
+
+import argparse
+import logging
+import shutil
+import statistics
+import tempfile
+import time
+from structra.api import generate_from_lines
+from structra.structure_processor import DURABILITY_LEVELS
+
+
+def build_spec(directories: int, files: int) -> list[str]:
+    """
+    Builds a spec with the given number of directories and files per directory.
+
+    Args:
+        directories (int): Number of directories below the root folder.
+        files (int): Number of files in every directory.
+
+    Returns:
+        list[str]: The lines of the spec.
+    """
+    lines = ["benchmark/"]
+    for directory in range(directories):
+        lines.append(f"├── dir_{directory}/")
+        lines.extend(f"│   ├── file_{file}.txt" for file in range(files))
+    return lines
+
+
+def run_benchmark(
+    lines: list[str], durability: str, runs: int, target: str = None
+) -> list[float]:
+    """
+    Generates the spec repeatedly and measures the duration of each run.
+
+    Args:
+        lines (list[str]): The lines of the spec.
+        durability (str): The durability level to measure.
+        runs (int): Number of runs.
+        target (str, optional): Directory to generate in. Defaults to the temp folder.
+
+    Returns:
+        list[float]: The duration of every run in seconds.
+    """
+    logger = logging.getLogger("structra_benchmark")
+    logger.addHandler(logging.NullHandler())
+    logger.propagate = False
+
+    durations = []
+    for _ in range(runs):
+        output_directory = tempfile.mkdtemp(dir=target)
+        try:
+            start = time.perf_counter()
+            generate_from_lines(lines, output_directory, logger, durability=durability)
+            durations.append(time.perf_counter() - start)
+        finally:
+            shutil.rmtree(output_directory)
+    return durations
+
+
+def main(args=None):
+    """
+    Runs the benchmark for every durability level and prints the results.
+
+    Args:
+        args (list, optional): Command-line arguments to parse. Defaults to None.
+    """
+    parser = argparse.ArgumentParser(description="Structra durability benchmark")
+    parser.add_argument("--dirs", type=int, default=100)
+    parser.add_argument("--files", type=int, default=100)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--target", type=str, default=None)
+    arguments = parser.parse_args(args)
+
+    lines = build_spec(arguments.dirs, arguments.files)
+    print(f"{len(lines)} entries, {arguments.runs} runs per level")
+
+    # Interleave the levels so that drift in the storage affects all of them alike.
+    durations = {durability: [] for durability in DURABILITY_LEVELS}
+    for _ in range(arguments.runs):
+        for durability in DURABILITY_LEVELS:
+            durations[durability].extend(
+                run_benchmark(lines, durability, 1, arguments.target)
+            )
+
+    for durability, level_durations in durations.items():
+        median = statistics.median(level_durations)
+        print(
+            f"{durability:>5}: median {median:.3f}s "
+            f"(min {min(level_durations):.3f}s, max {max(level_durations):.3f}s), "
+            f"{len(lines) / median:,.0f} entries/s"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+# -----------------------------------------------------------------------------
+# Structra - A tool to generate folder and file structures based on input text files
+#
+# Copyright (c) 2024 Jonas Zeihe
+# Licensed under the MIT License. See LICENSE file in the project root for details.
+#
+# Project URL: https://github.com/jonaszeihe/structra
+# Contact: JonasZeihe@gmail.com
+# -----------------------------------------------------------------------------
+
+# benchmark_sharding.py
+
+"""
+Measures how sharded generation scales with the number of worker processes.
+
+Run from the src folder, optionally pointing --target at the storage to measure:
+
+    python -m benchmarks.benchmark_sharding --dirs 200 --files 250 --workers 1 2 4 8
+
+The unsharded single-worker run is always measured first and is the baseline of
+the reported speedups.
+
+Author: Jonas Zeihe
+"""
+
+import argparse
+import logging
+import os
+import shutil
+import statistics
+import tempfile
+import time
+from pathlib import Path
+from benchmarks.benchmark_durability import build_spec
+from structra.sharding import ShardedGenerator
+from structra.structure_processor import StructureProcessor
+
+
+def run_benchmark(
+    lines: list[str], workers: int, runs: int, target: str = None
+) -> list[float]:
+    """
+    Generates the spec repeatedly and measures the duration of each run.
+
+    One worker runs in-process without sharding and serves as the baseline.
+
+    Args:
+        lines (list[str]): The lines of the spec.
+        workers (int): The number of worker processes.
+        runs (int): Number of runs.
+        target (str, optional): Directory to generate in. Defaults to the temp folder.
+
+    Returns:
+        list[float]: The duration of every run in seconds, including parsing.
+    """
+    logger = logging.getLogger("structra_benchmark")
+    logger.addHandler(logging.NullHandler())
+    logger.propagate = False
+
+    durations = []
+    for _ in range(runs):
+        output_directory = Path(tempfile.mkdtemp(dir=target))
+        try:
+            start = time.perf_counter()
+            processor = StructureProcessor(output_directory, logger)
+            if workers == 1:
+                processor.create_entries(processor.iter_entries(lines))
+            else:
+                entries = processor.parse_pbs_lines(lines)
+                ShardedGenerator(output_directory, logger, workers).generate(entries)
+            durations.append(time.perf_counter() - start)
+        finally:
+            shutil.rmtree(output_directory)
+    return durations
+
+
+def main(args=None):
+    """
+    Runs the benchmark for every worker count and prints the speedups.
+
+    Args:
+        args (list, optional): Command-line arguments to parse. Defaults to None.
+    """
+    parser = argparse.ArgumentParser(description="Structra sharding benchmark")
+    parser.add_argument("--dirs", type=int, default=200)
+    parser.add_argument("--files", type=int, default=250)
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--target", type=str, default=None)
+    arguments = parser.parse_args(args)
+
+    lines = build_spec(arguments.dirs, arguments.files)
+    print(
+        f"{len(lines)} entries, {arguments.runs} runs per worker count, "
+        f"{os.cpu_count()} CPU(s)"
+    )
+    # The unsharded run is always measured first, as the baseline of the speedup.
+    worker_counts = [1] + [workers for workers in arguments.workers if workers != 1]
+    baseline = None
+    for workers in worker_counts:
+        durations = run_benchmark(lines, workers, arguments.runs, arguments.target)
+        median = statistics.median(durations)
+        baseline = baseline or median
+        print(
+            f"{workers:>3} worker(s): median {median:.3f}s "
+            f"(min {min(durations):.3f}s, max {max(durations):.3f}s), "
+            f"{len(lines) / median:,.0f} entries/s, speedup {baseline / median:.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,32 @@
+# -----------------------------------------------------------------------------
+# Structra - A tool to generate folder and file structures based on input text files
+#
+# Copyright (c) 2024 Jonas Zeihe
+# Licensed under the MIT License. See LICENSE file in the project root for details.
+#
+# Project URL: https://github.com/jonaszeihe/structra
+# Contact: JonasZeihe@gmail.com
+# -----------------------------------------------------------------------------
+
+# __init__.py
+
+"""
+Structra generates folder and file structures from tree-structured specs.
+
+The functions exported here let library callers generate a structure from a spec
+held in memory.
+"""
+
+from structra.api import (
+    generate_from_lines,
+    generate_from_string,
+    generate_from_structure,
+)
+from structra.structure_processor import ProcessingStats
+
+__all__ = [
+    "ProcessingStats",
+    "generate_from_lines",
+    "generate_from_string",
+    "generate_from_structure",
+]
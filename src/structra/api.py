@@ -0,0 +1,208 @@
+# -----------------------------------------------------------------------------
+# Structra - A tool to generate folder and file structures based on input text files
+#
+# Copyright (c) 2024 Jonas Zeihe
+# Licensed under the MIT License. See LICENSE file in the project root for details.
+#
+# Project URL: https://github.com/jonaszeihe/structra
+# Contact: JonasZeihe@gmail.com
+# -----------------------------------------------------------------------------
+
+# api.py
+
+"""
+Public API for generating structures from specs held in memory.
+
+Library callers can pass a spec as a string, as an iterable of lines or as a
+nested structure of dicts and lists, without writing it to a file first.
+
+Author: Jonas Zeihe
+"""
+
+from pathlib import Path
+from typing import Iterable, Iterator, Optional, Union
+import logging
+from structra.structure_processor import (
+    ProcessingStats,
+    SpecEntry,
+    StructureProcessor,
+    split_metadata,
+)
+
+Structure = Union[dict, list, str, None]
+
+
+def generate_from_string(
+    spec: str,
+    output_directory: Union[str, Path],
+    logger: Optional[logging.Logger] = None,
+    **processor_options,
+) -> ProcessingStats:
+    """
+    Generates the structure described by a PBS spec given as a string.
+
+    Args:
+        spec (str): The PBS spec.
+        output_directory (str | Path): The directory the structure is generated in.
+        logger (logging.Logger, optional): Logger to use. Defaults to the Structra logger.
+        **processor_options: Further keyword arguments for StructureProcessor.
+
+    Returns:
+        ProcessingStats: Counts of the created entries and errors.
+    """
+    return generate_from_lines(
+        spec.splitlines(), output_directory, logger, **processor_options
+    )
+
+
+def generate_from_lines(
+    lines: Iterable[str],
+    output_directory: Union[str, Path],
+    logger: Optional[logging.Logger] = None,
+    **processor_options,
+) -> ProcessingStats:
+    """
+    Generates the structure described by the lines of a PBS spec.
+
+    The lines are consumed lazily, so a generator can produce them while the
+    structure is being created.
+
+    Args:
+        lines (Iterable[str]): The lines of the PBS spec.
+        output_directory (str | Path): The directory the structure is generated in.
+        logger (logging.Logger, optional): Logger to use. Defaults to the Structra logger.
+        **processor_options: Further keyword arguments for StructureProcessor.
+
+    Returns:
+        ProcessingStats: Counts of the created entries and errors.
+    """
+    processor = _create_processor(output_directory, logger, processor_options)
+    processor.create_entries(processor.iter_entries(lines))
+    return processor.stats
+
+
+def generate_from_structure(
+    structure: dict,
+    output_directory: Union[str, Path],
+    logger: Optional[logging.Logger] = None,
+    **processor_options,
+) -> ProcessingStats:
+    """
+    Generates the structure described by nested dicts and lists.
+
+    Every dict maps names to their contents: a dict or list makes the name a
+    directory, None makes it a file unless the name ends in "/". A list holds file
+    names, directory names ending in "/" and dicts. Names may carry a metadata block such as "{mode=644}".
+
+    Example:
+        {"project": {"src": ["main.py", "util/"], "README.md": None}}
+
+    Args:
+        structure (dict): The nested structure, keyed by the root folder name(s).
+        output_directory (str | Path): The directory the structure is generated in.
+        logger (logging.Logger, optional): Logger to use. Defaults to the Structra logger.
+        **processor_options: Further keyword arguments for StructureProcessor.
+
+    Returns:
+        ProcessingStats: Counts of the created entries and errors.
+
+    Raises:
+        TypeError: If the structure contains anything but dicts, lists, strings and None.
+        ValueError: If a name carries invalid metadata.
+    """
+    if not isinstance(structure, dict):
+        raise TypeError(
+            f"Structure must be a dict of root folders, not {type(structure).__name__}."
+        )
+    processor = _create_processor(output_directory, logger, processor_options)
+    processor.create_entries(list(iter_structure_entries(structure)))
+    return processor.stats
+
+
+def iter_structure_entries(
+    structure: Structure, parent: str = ""
+) -> Iterator[SpecEntry]:
+    """
+    Converts a nested structure into entries, parents before children.
+
+    Args:
+        structure (dict | list | str | None): The nested structure.
+        parent (str): Path of the directory the structure belongs to.
+
+    Yields:
+        SpecEntry: The entries described by the structure.
+
+    Raises:
+        TypeError: If the structure contains anything but dicts, lists, strings and None.
+        ValueError: If a name carries invalid metadata.
+    """
+    if isinstance(structure, dict):
+        for name, children in structure.items():
+            if children is not None and not isinstance(children, (dict, list)):
+                raise TypeError(
+                    f"Contents of '{name}' must be a dict, list or None, "
+                    f"not {type(children).__name__}."
+                )
+            yield from _iter_named_entry(name, children, parent)
+    elif isinstance(structure, list):
+        for item in structure:
+            if isinstance(item, str):
+                yield from _iter_named_entry(item, None, parent)
+            else:
+                yield from iter_structure_entries(item, parent)
+    else:
+        raise TypeError(
+            f"Structure items must be dicts, lists or names, not {type(structure).__name__}."
+        )
+
+
+def _iter_named_entry(
+    name: str, children: Structure, parent: str
+) -> Iterator[SpecEntry]:
+    """
+    Yields the entry for a single name and, for directories, its children.
+
+    The name describes a directory if it has children or ends in "/".
+
+    Args:
+        name (str): The name, optionally with a trailing "/" and a metadata block.
+        children (dict | list | None): The contents of a directory, None for a file
+            or an empty directory.
+        parent (str): Path of the directory the name belongs to.
+
+    Yields:
+        SpecEntry: The entry and the entries of its children.
+    """
+    clean_name, metadata, errors = split_metadata(name.strip())
+    if errors:
+        raise ValueError(f"Invalid metadata for '{name}': {', '.join(errors)}.")
+    is_dir = children is not None or clean_name.endswith("/")
+    clean_name = clean_name.rstrip("/")
+    entry_path = f"{parent}/{clean_name}" if parent else clean_name
+
+    yield SpecEntry(entry_path, is_dir, **metadata)
+    if children:
+        yield from iter_structure_entries(children, entry_path)
+
+
+def _create_processor(
+    output_directory: Union[str, Path],
+    logger: Optional[logging.Logger],
+    processor_options: dict,
+) -> StructureProcessor:
+    """
+    Creates a StructureProcessor for a single API call.
+
+    Args:
+        output_directory (str | Path): The directory the structure is generated in.
+        logger (logging.Logger, optional): Logger to use. Defaults to the Structra logger.
+        processor_options (dict): Further keyword arguments for StructureProcessor.
+
+    Returns:
+        StructureProcessor: The processor.
+    """
+    return StructureProcessor(
+        Path(output_directory),
+        logger or logging.getLogger("structra_logger"),
+        **processor_options,
+    )
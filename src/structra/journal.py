@@ -0,0 +1,143 @@
+# -----------------------------------------------------------------------------
+# Structra - A tool to generate folder and file structures based on input text files
+#
+# Copyright (c) 2024 Jonas Zeihe
+# Licensed under the MIT License. See LICENSE file in the project root for details.
+#
+# Project URL: https://github.com/jonaszeihe/structra
+# Contact: JonasZeihe@gmail.com
+# -----------------------------------------------------------------------------
+
+# journal.py
+
+"""
+Checkpoint journal that lets an interrupted generation resume where it stopped.
+
+The journal starts with a header holding the content hash of the spec, followed by
+one line per checkpoint with the number of entries completed so far. Checkpoints are
+written in batches, and the journal is deleted once the generation completes.
+
+Author: Jonas Zeihe
+"""
+
+from pathlib import Path
+from typing import Optional, TextIO
+import logging
+
+JOURNAL_HEADER = "structra-journal 1"
+
+
+class GenerationJournal:
+    """
+    Records and restores the progress of generating a single spec.
+    """
+
+    def __init__(
+        self,
+        journal_path: Path,
+        spec_digest: str,
+        logger: logging.Logger,
+        interval: int = 1000,
+    ):
+        """
+        Initializes the GenerationJournal.
+
+        Args:
+            journal_path (Path): The file the journal is kept in.
+            spec_digest (str): Content hash of the spec being generated.
+            logger (logging.Logger): Logger for logging messages and errors.
+            interval (int): Number of entries between two checkpoints.
+        """
+        self.journal_path = journal_path
+        self.spec_digest = spec_digest
+        self.logger = logger
+        self.interval = interval
+        self.resume_index = 0
+        self._last_checkpoint = 0
+        self._file: Optional[TextIO] = None
+
+    def open(self) -> int:
+        """
+        Validates an existing journal against the spec and opens it for writing.
+
+        A journal written for a different spec is discarded and a new one started.
+
+        Returns:
+            int: The number of entries already completed, 0 for a fresh start.
+        """
+        self.resume_index = self._read_checkpoint()
+        self._last_checkpoint = self.resume_index
+
+        if self.resume_index:
+            self.logger.info(
+                f"Resuming after {self.resume_index} entries from journal "
+                f"'{self.journal_path}'."
+            )
+            self._file = open(self.journal_path, "a", encoding="utf-8")
+        else:
+            self._file = open(self.journal_path, "w", encoding="utf-8")
+            self._file.write(f"{JOURNAL_HEADER} {self.spec_digest}\n")
+            self._file.flush()
+        return self.resume_index
+
+    def record(self, completed: int) -> None:
+        """
+        Notes that the given number of entries is complete, writing a checkpoint
+        once a full batch has been completed since the last one.
+
+        Args:
+            completed (int): The number of entries completed so far.
+        """
+        if completed - self._last_checkpoint < self.interval:
+            return
+        self._file.write(f"{completed}\n")
+        self._file.flush()
+        self._last_checkpoint = completed
+
+    def complete(self) -> None:
+        """
+        Closes and deletes the journal after the generation finished.
+        """
+        self.close()
+        try:
+            self.journal_path.unlink()
+        except FileNotFoundError:
+            pass
+
+    def close(self) -> None:
+        """
+        Closes the journal, keeping it for a later resume.
+        """
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def _read_checkpoint(self) -> int:
+        """
+        Reads the last complete checkpoint of an existing journal.
+
+        Returns:
+            int: The number of entries completed, or 0 if there is no valid journal
+            for the current spec.
+        """
+        try:
+            with open(self.journal_path, "r", encoding="utf-8") as file:
+                lines = file.read().split("\n")
+        except FileNotFoundError:
+            return 0
+        except OSError as e:
+            self.logger.error(f"Failed to read journal '{self.journal_path}': {e}")
+            return 0
+
+        if lines[0] != f"{JOURNAL_HEADER} {self.spec_digest}":
+            self.logger.warning(
+                f"Journal '{self.journal_path}' does not match the spec, starting over."
+            )
+            return 0
+
+        checkpoint = 0
+        # The last element follows the final newline; it is empty or a torn write.
+        for line in lines[1:-1]:
+            if line.isdigit():
+                checkpoint = int(line)
+        return checkpoint
@@ -0,0 +1,218 @@
+# -----------------------------------------------------------------------------
+# Structra - A tool to generate folder and file structures based on input text files
+#
+# Copyright (c) 2024 Jonas Zeihe
+# Licensed under the MIT License. See LICENSE file in the project root for details.
+#
+# Project URL: https://github.com/jonaszeihe/structra
+# Contact: JonasZeihe@gmail.com
+# -----------------------------------------------------------------------------
+
+# linter.py
+
+"""
+Validates Project Structure (PBS) files without touching the filesystem.
+
+A spec is checked in a single pass: every line is cleaned, measured and resolved
+against the same path stack the StructureProcessor uses, while a hash set of all
+declared paths detects duplicate and conflicting siblings. All problems are
+collected with their line numbers instead of stopping at the first one.
+
+Author: Jonas Zeihe
+"""
+
+from dataclasses import dataclass
+from typing import Iterable
+import os
+import re
+from structra.structure_processor import StructureProcessor, split_metadata
+
+WINDOWS_ILLEGAL_CHARACTERS = re.compile(r'[<>:"\\|?*\x00-\x1f]')
+POSIX_ILLEGAL_CHARACTERS = re.compile(r"\x00")
+WINDOWS_RESERVED_NAMES = frozenset(
+    ["CON", "PRN", "AUX", "NUL"]
+    + [f"COM{number}" for number in range(1, 10)]
+    + [f"LPT{number}" for number in range(1, 10)]
+)
+MAX_NAME_BYTES = 255
+
+
+@dataclass(frozen=True)
+class SpecProblem:
+    """
+    A single problem found in a PBS file.
+
+    Attributes:
+        line_number (int): The line the problem was found on.
+        message (str): Description of the problem.
+    """
+
+    line_number: int
+    message: str
+
+
+class SpecLinter:
+    """
+    Checks PBS files for indentation, duplicate, type and naming problems.
+    """
+
+    def __init__(self, processor: StructureProcessor, portable: bool = False):
+        """
+        Initializes the SpecLinter.
+
+        Args:
+            processor (StructureProcessor): Processor whose line parsing rules are checked.
+            portable (bool): If True, names must also be valid on Windows regardless
+                of the current platform.
+        """
+        self.processor = processor
+        self.windows_names = portable or os.name == "nt"
+
+    def check(self, lines: Iterable[str]) -> list[SpecProblem]:
+        """
+        Checks the lines of a PBS file.
+
+        Args:
+            lines (Iterable[str]): The lines of the PBS file.
+
+        Returns:
+            list[SpecProblem]: Every problem found, in line order.
+        """
+        problems: list[SpecProblem] = []
+        declared: dict[str, tuple[bool, int]] = {}
+        root_folder = None
+        path_stack: list[str] = []
+        previous_file = None
+
+        for line_number, line in enumerate(lines, start=1):
+            clean_line = self.processor._clean_line(line)
+            if not clean_line:
+                continue
+
+            clean_line, _, errors = split_metadata(clean_line)
+            for error in errors:
+                problems.append(SpecProblem(line_number, f"{error}."))
+
+            if root_folder is None:
+                root_folder = self.processor._get_root_folder(clean_line)
+                path_stack.append(root_folder)
+                declared[root_folder] = (True, line_number)
+                self._check_name(root_folder, line_number, problems)
+                continue
+
+            if clean_line == root_folder:
+                continue
+
+            indent = len(line) - len(line.lstrip(" │"))
+            level = indent // 4
+            if indent % 4:
+                problems.append(
+                    SpecProblem(
+                        line_number,
+                        f"Indentation of {indent} is not a multiple of 4.",
+                    )
+                )
+
+            if level >= len(path_stack):
+                if previous_file is not None and level == len(path_stack):
+                    problems.append(
+                        SpecProblem(
+                            line_number,
+                            f"'{previous_file}' is a file but is used as a directory.",
+                        )
+                    )
+                else:
+                    problems.append(
+                        SpecProblem(
+                            line_number,
+                            f"Indentation level {level} skips a level "
+                            f"(deepest open directory is level {len(path_stack) - 1}).",
+                        )
+                    )
+
+            self.processor._adjust_path_stack(path_stack, level)
+
+            is_dir = clean_line.endswith("/")
+            name = clean_line.rstrip("/")
+            self._check_name(name, line_number, problems)
+
+            entry_path = f"{path_stack[-1]}/{name}"
+            existing = declared.get(entry_path)
+            if existing is None:
+                declared[entry_path] = (is_dir, line_number)
+            elif existing[0] == is_dir:
+                problems.append(
+                    SpecProblem(
+                        line_number,
+                        f"Duplicate entry '{entry_path}' (first declared on "
+                        f"line {existing[1]}).",
+                    )
+                )
+            else:
+                problems.append(
+                    SpecProblem(
+                        line_number,
+                        f"'{entry_path}' is declared as both a file and a directory "
+                        f"(first declared on line {existing[1]}).",
+                    )
+                )
+
+            if is_dir:
+                path_stack.append(entry_path)
+                previous_file = None
+            else:
+                previous_file = entry_path
+
+        if root_folder is None:
+            problems.append(SpecProblem(0, "The spec does not declare a root folder."))
+
+        return problems
+
+    def _check_name(
+        self, name: str, line_number: int, problems: list[SpecProblem]
+    ) -> None:
+        """
+        Checks that a single entry name is valid on the target filesystem.
+
+        Args:
+            name (str): The entry name without trailing slash.
+            line_number (int): The line the name was declared on.
+            problems (list[SpecProblem]): The list to append problems to.
+        """
+        if name in ("", ".", ".."):
+            problems.append(SpecProblem(line_number, f"Invalid name '{name}'."))
+            return
+        if "/" in name:
+            problems.append(
+                SpecProblem(line_number, f"Name '{name}' contains a path separator.")
+            )
+
+        illegal = (
+            WINDOWS_ILLEGAL_CHARACTERS
+            if self.windows_names
+            else POSIX_ILLEGAL_CHARACTERS
+        )
+        if illegal.search(name):
+            problems.append(
+                SpecProblem(line_number, f"Name '{name}' contains illegal characters.")
+            )
+        if len(name.encode("utf-8")) > MAX_NAME_BYTES:
+            problems.append(
+                SpecProblem(
+                    line_number,
+                    f"Name '{name[:32]}...' exceeds {MAX_NAME_BYTES} bytes.",
+                )
+            )
+
+        if self.windows_names:
+            if name.split(".")[0].upper() in WINDOWS_RESERVED_NAMES:
+                problems.append(
+                    SpecProblem(line_number, f"Name '{name}' is reserved on Windows.")
+                )
+            if name.endswith((".", " ")):
+                problems.append(
+                    SpecProblem(
+                        line_number,
+                        f"Name '{name}' ends with a dot or space, which Windows drops.",
+                    )
+                )
@@ -20,10 +20,23 @@ Author: Jonas Zeihe
 """
 
 import argparse
+import multiprocessing
 import sys
 from pathlib import Path
+from typing import Optional
 from structra.logger_config import setup_logger
-from structra.structure_processor import StructureProcessor
+from structra.structure_processor import (
+    DURABILITY_LEVELS,
+    StructureProcessor,
+    parse_mode,
+    parse_timestamp,
+)
+from structra.linter import SpecLinter
+from structra.sharding import ShardedGenerator
+from structra.syncer import StructureSyncer
+from structra.watcher import SpecWatcher
+
+STDIN_ARGUMENT = "-"
 
 
 def main(args=None):
@@ -45,7 +58,65 @@ def main(args=None):
             logger.error("File validation failed.")
             sys.exit(1)
 
-        process_files(arguments.files, logger, arguments.root_folder)
+        if arguments.watch and STDIN_ARGUMENT in arguments.files:
+            logger.error("Watch mode cannot read a structure from stdin.")
+            sys.exit(1)
+
+        if arguments.resume and STDIN_ARGUMENT in arguments.files:
+            logger.error("A structure read from stdin cannot be resumed.")
+            sys.exit(1)
+
+        if arguments.resume and arguments.workers > 1:
+            logger.error("A sharded generation cannot be resumed.")
+            sys.exit(1)
+
+        if arguments.resume and arguments.watch:
+            logger.error("Watch mode cannot be resumed.")
+            sys.exit(1)
+
+        if arguments.resume and arguments.sync:
+            logger.error("A sync cannot be resumed.")
+            sys.exit(1)
+
+        processor_options = get_processor_options(arguments)
+
+        if arguments.check:
+            if not check_files(arguments.files, logger, arguments.portable):
+                logger.error("Structure check failed.")
+                sys.exit(1)
+        elif arguments.watch:
+            watch_files(
+                arguments.files,
+                logger,
+                arguments.root_folder,
+                arguments.poll_interval,
+                arguments.prune,
+                processor_options,
+            )
+        elif arguments.sync:
+            if not sync_files(
+                arguments.files,
+                logger,
+                arguments.root_folder,
+                arguments.dry_run,
+                arguments.max_deletions,
+                processor_options,
+            ):
+                logger.error("Sync failed.")
+                sys.exit(1)
+        elif arguments.workers > 1:
+            shard_files(
+                arguments.files,
+                logger,
+                arguments.root_folder,
+                arguments.workers,
+                arguments.shard_depth,
+                processor_options,
+            )
+        else:
+            process_files(
+                arguments.files, logger, arguments.root_folder, processor_options
+            )
 
         logger.info("Structra completed successfully.")
     except FileNotFoundError as file_error:
@@ -72,7 +143,7 @@ def parse_arguments(args=None):
         metavar="FILE",
         type=str,
         nargs="+",
-        help="Path(s) to the .txt file(s) defining the structure(s).",
+        help="Path(s) to the .txt file(s) defining the structure(s), or - to read from stdin.",
     )
     parser.add_argument(
         "--logging", action="store_true", help="Enable logging to file and console"
@@ -83,12 +154,125 @@ def parse_arguments(args=None):
         default="structra_output",
         help="Name of the root folder where the structure will be generated.",
     )
+    parser.add_argument(
+        "--watch",
+        action="store_true",
+        help="Keep running and re-apply changes to the structure file(s) incrementally.",
+    )
+    parser.add_argument(
+        "--poll-interval",
+        type=float,
+        default=1.0,
+        help="Seconds between two checks of the structure file(s) in watch mode.",
+    )
+    parser.add_argument(
+        "--prune",
+        action="store_true",
+        help="In watch mode, also remove entries that were deleted from a structure file.",
+    )
+    parser.add_argument(
+        "--sync",
+        action="store_true",
+        help="Remove entries below the root folder(s) that are not in the structure file(s).",
+    )
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="With --sync, only list the entries that would be removed.",
+    )
+    parser.add_argument(
+        "--max-deletions",
+        type=int,
+        default=1000,
+        help="With --sync, refuse to remove more than this many entries.",
+    )
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help="Only validate the structure file(s) and report every problem found.",
+    )
+    parser.add_argument(
+        "--portable",
+        action="store_true",
+        help="With --check, require names that are also valid on Windows.",
+    )
+    parser.add_argument(
+        "--dir-mode",
+        type=parse_mode,
+        default=None,
+        help="Octal permission mode for directories without a mode of their own.",
+    )
+    parser.add_argument(
+        "--file-mode",
+        type=parse_mode,
+        default=None,
+        help="Octal permission mode for files without a mode of their own.",
+    )
+    parser.add_argument(
+        "--mtime",
+        type=parse_timestamp,
+        default=None,
+        help="Timestamp (epoch seconds or ISO 8601) for entries without one of their own.",
+    )
+    parser.add_argument(
+        "--durability",
+        choices=DURABILITY_LEVELS,
+        default="none",
+        help="How created entries are flushed to disk (default: none).",
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Keep a checkpoint journal and continue an interrupted generation from it.",
+    )
+    parser.add_argument(
+        "--checkpoint-interval",
+        type=int,
+        default=1000,
+        help="With --resume, number of entries between two checkpoints.",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Split each structure into subtrees and generate them with this many processes.",
+    )
+    parser.add_argument(
+        "--shard-depth",
+        type=int,
+        default=1,
+        help="With --workers, depth at which structures are split (1 = below the root folder).",
+    )
     return parser.parse_args(args)
 
 
+def get_processor_options(arguments) -> dict:
+    """
+    Collects the StructureProcessor options that were set on the command line.
+
+    Args:
+        arguments (Namespace): Parsed command-line arguments.
+
+    Returns:
+        dict: Keyword arguments for StructureProcessor.
+    """
+    options = {
+        "dir_mode": arguments.dir_mode,
+        "file_mode": arguments.file_mode,
+        "mtime": arguments.mtime,
+        "durability": None if arguments.durability == "none" else arguments.durability,
+        "resume": arguments.resume or None,
+        "checkpoint_interval": (
+            arguments.checkpoint_interval if arguments.resume else None
+        ),
+    }
+    return {key: value for key, value in options.items() if value is not None}
+
+
 def validate_files(files: list[str], logger) -> bool:
     """
     Validates the provided file paths to ensure they exist and have the correct format.
+    A single "-" is accepted and stands for stdin.
 
     Args:
         files (list[str]): List of file paths to validate.
@@ -97,8 +281,15 @@ def validate_files(files: list[str], logger) -> bool:
     Returns:
         bool: True if all files are valid, False otherwise.
     """
+    if files.count(STDIN_ARGUMENT) > 1:
+        logger.error("Stdin ('-') can only be given once.")
+        return False
+
     invalid_files = [
-        file for file in files if not Path(file).exists() or not file.endswith(".txt")
+        file
+        for file in files
+        if file != STDIN_ARGUMENT
+        and (not Path(file).exists() or not file.endswith(".txt"))
     ]
     if invalid_files:
         for file in invalid_files:
@@ -107,7 +298,12 @@ def validate_files(files: list[str], logger) -> bool:
     return True
 
 
-def process_files(files: list[str], logger, root_folder_name: str):
+def process_files(
+    files: list[str],
+    logger,
+    root_folder_name: str,
+    processor_options: Optional[dict] = None,
+):
     """
     Processes the list of files to generate the folder and file structure.
 
@@ -115,15 +311,174 @@ def process_files(files: list[str], logger, root_folder_name: str):
         files (list[str]): List of file paths.
         logger (Logger): Logger instance for logging.
         root_folder_name (str): Name of the root folder where the structure will be generated.
+        processor_options (dict, optional): Keyword arguments for StructureProcessor.
     """
     output_directory = Path.cwd() / root_folder_name
     logger.info(f"Output directory set to: {output_directory}")
 
     for file_path_str in files:
-        file_path = Path(file_path_str)
+        processor = StructureProcessor(
+            output_directory, logger, **(processor_options or {})
+        )
+        if file_path_str == STDIN_ARGUMENT:
+            processor.process_pbs_stream(read_stdin())
+        else:
+            processor.process_pbs_file(Path(file_path_str))
+
+
+def check_files(files: list[str], logger, portable: bool = False) -> bool:
+    """
+    Validates the structure files without creating anything.
+
+    Args:
+        files (list[str]): List of file paths.
+        logger (Logger): Logger instance for logging.
+        portable (bool): If True, names must also be valid on Windows.
 
-        processor = StructureProcessor(output_directory, logger)
-        processor.process_pbs_file(file_path)
+    Returns:
+        bool: True if no problems were found, False otherwise.
+    """
+    linter = SpecLinter(StructureProcessor(Path.cwd(), logger), portable)
+    problem_count = 0
+
+    for file_path_str in files:
+        if file_path_str == STDIN_ARGUMENT:
+            problems = linter.check(read_stdin())
+        else:
+            with open(file_path_str, "r", encoding="utf-8") as file:
+                problems = linter.check(file)
+
+        for problem in problems:
+            logger.error(f"{file_path_str}:{problem.line_number}: {problem.message}")
+        logger.info(f"Checked '{file_path_str}': {len(problems)} problem(s) found.")
+        problem_count += len(problems)
+
+    return problem_count == 0
+
+
+def shard_files(
+    files: list[str],
+    logger,
+    root_folder_name: str,
+    workers: int,
+    shard_depth: int = 1,
+    processor_options: Optional[dict] = None,
+):
+    """
+    Generates each file with several worker processes, one shard of subtrees each.
+
+    Args:
+        files (list[str]): List of file paths.
+        logger (Logger): Logger instance for logging.
+        root_folder_name (str): Name of the root folder where the structure will be generated.
+        workers (int): Number of worker processes.
+        shard_depth (int): Depth at which the structures are split into subtrees.
+        processor_options (dict, optional): Keyword arguments for StructureProcessor.
+    """
+    output_directory = Path.cwd() / root_folder_name
+    logger.info(f"Output directory set to: {output_directory}")
+
+    processor = StructureProcessor(
+        output_directory, logger, **(processor_options or {})
+    )
+    generator = ShardedGenerator(
+        output_directory, logger, workers, shard_depth, processor_options
+    )
+    for file_path_str in files:
+        if file_path_str == STDIN_ARGUMENT:
+            entries = processor.parse_pbs_lines(read_stdin())
+        else:
+            entries = processor.load_pbs_file(Path(file_path_str))
+        generator.generate(entries)
+
+
+def watch_files(
+    files: list[str],
+    logger,
+    root_folder_name: str,
+    poll_interval: float = 1.0,
+    prune: bool = False,
+    processor_options: Optional[dict] = None,
+):
+    """
+    Generates the structure once and then re-applies changes to the files incrementally.
+
+    Args:
+        files (list[str]): List of file paths.
+        logger (Logger): Logger instance for logging.
+        root_folder_name (str): Name of the root folder where the structure will be generated.
+        poll_interval (float): Seconds between two checks of the files.
+        prune (bool): If True, entries deleted from a file are removed from disk.
+        processor_options (dict, optional): Keyword arguments for StructureProcessor.
+    """
+    output_directory = Path.cwd() / root_folder_name
+    logger.info(f"Output directory set to: {output_directory}")
+
+    processor = StructureProcessor(
+        output_directory, logger, **(processor_options or {})
+    )
+    watcher = SpecWatcher(
+        [Path(file) for file in files], processor, logger, poll_interval, prune
+    )
+    watcher.run()
+
+
+def sync_files(
+    files: list[str],
+    logger,
+    root_folder_name: str,
+    dry_run: bool = False,
+    max_deletions: int = 1000,
+    processor_options: Optional[dict] = None,
+) -> bool:
+    """
+    Brings the output directory into exact agreement with the files.
+
+    Entries absent from all files are removed before missing entries are created.
+    If the removal is aborted, nothing is created.
+
+    Args:
+        files (list[str]): List of file paths.
+        logger (Logger): Logger instance for logging.
+        root_folder_name (str): Name of the root folder where the structure will be generated.
+        dry_run (bool): If True, only list the entries that would be removed.
+        max_deletions (int): Refuse to remove more than this many entries.
+        processor_options (dict, optional): Keyword arguments for StructureProcessor.
+
+    Returns:
+        bool: False if the sync was aborted or an entry could not be removed, True
+        otherwise.
+    """
+    output_directory = Path.cwd() / root_folder_name
+    logger.info(f"Output directory set to: {output_directory}")
+
+    processor = StructureProcessor(
+        output_directory, logger, **(processor_options or {})
+    )
+    entries = []
+    for file_path_str in files:
+        if file_path_str == STDIN_ARGUMENT:
+            entries.extend(processor.parse_pbs_lines(read_stdin()))
+        else:
+            entries.extend(processor.load_pbs_file(Path(file_path_str)))
+
+    syncer = StructureSyncer(output_directory, logger, max_deletions)
+    if syncer.sync(entries, dry_run) is None:
+        return False
+    if not dry_run:
+        processor.create_entries(entries)
+    return not syncer.stats.errors
+
+
+def read_stdin():
+    """
+    Prepares stdin for reading a PBS structure line by line.
+
+    Returns:
+        TextIO: The stdin stream, decoded as UTF-8.
+    """
+    sys.stdin.reconfigure(encoding="utf-8")
+    return sys.stdin
 
 
 def handle_error(logger, error_message):
@@ -142,4 +497,5 @@ def handle_error(logger, error_message):
 
 
 if __name__ == "__main__":
+    multiprocessing.freeze_support()
     main()
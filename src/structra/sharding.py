@@ -0,0 +1,206 @@
+# -----------------------------------------------------------------------------
+# Structra - A tool to generate folder and file structures based on input text files
+#
+# Copyright (c) 2024 Jonas Zeihe
+# Licensed under the MIT License. See LICENSE file in the project root for details.
+#
+# Project URL: https://github.com/jonaszeihe/structra
+# Contact: JonasZeihe@gmail.com
+# -----------------------------------------------------------------------------
+
+# sharding.py
+
+"""
+Generates a single parsed spec with several worker processes.
+
+The entries are split at the subtrees found at a configurable depth. The ancestors
+above that depth are shared and created once by the calling process, the subtrees
+are packed into balanced shards and every shard is generated by its own worker.
+The statistics and errors of all workers are merged into one report.
+
+Author: Jonas Zeihe
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+import heapq
+import logging
+from structra.structure_processor import ProcessingStats, SpecEntry, StructureProcessor
+
+
+class _ErrorCollector(logging.Handler):
+    """
+    Logging handler that keeps the messages of all error records.
+    """
+
+    def __init__(self):
+        super().__init__(logging.ERROR)
+        self.messages: list[str] = []
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.messages.append(record.getMessage())
+
+
+def split_entries(
+    entries: list[SpecEntry], depth: int = 1
+) -> tuple[list[SpecEntry], list[list[SpecEntry]]]:
+    """
+    Splits entries into the shared ancestors and the subtrees at the given depth.
+
+    Args:
+        entries (list[SpecEntry]): The entries of a spec in file order.
+        depth (int): Depth of the subtree roots; 1 splits at the children of the
+            root folder.
+
+    Returns:
+        tuple[list[SpecEntry], list[list[SpecEntry]]]: The entries above the split
+        depth and the subtrees, each in file order.
+    """
+    shared: list[SpecEntry] = []
+    subtrees: list[list[SpecEntry]] = []
+    for entry in entries:
+        entry_depth = entry.path.count("/")
+        if entry_depth < depth:
+            shared.append(entry)
+        elif entry_depth == depth or not subtrees:
+            subtrees.append([entry])
+        else:
+            subtrees[-1].append(entry)
+    return shared, subtrees
+
+
+def balance_subtrees(
+    subtrees: list[list[SpecEntry]], shard_count: int
+) -> list[list[SpecEntry]]:
+    """
+    Packs subtrees into shards of similar size, largest subtree first.
+
+    Args:
+        subtrees (list[list[SpecEntry]]): The subtrees to pack.
+        shard_count (int): The number of shards to create.
+
+    Returns:
+        list[list[SpecEntry]]: The non-empty shards.
+    """
+    shards: list[list[SpecEntry]] = [[] for _ in range(max(shard_count, 1))]
+    loads = [(0, index) for index in range(len(shards))]
+    for subtree in sorted(subtrees, key=len, reverse=True):
+        load, index = heapq.heappop(loads)
+        shards[index].extend(subtree)
+        heapq.heappush(loads, (load + len(subtree), index))
+    return [shard for shard in shards if shard]
+
+
+def generate_shard(
+    output_directory: Path, entries: list[SpecEntry], processor_options: dict
+) -> tuple[ProcessingStats, list[str]]:
+    """
+    Generates a single shard. Runs inside a worker process.
+
+    Args:
+        output_directory (Path): The root directory the structure is generated in.
+        entries (list[SpecEntry]): The entries of the shard.
+        processor_options (dict): Keyword arguments for StructureProcessor.
+
+    Returns:
+        tuple[ProcessingStats, list[str]]: The counts and the error messages of the shard.
+    """
+    collector = _ErrorCollector()
+    logger = logging.getLogger("structra_shard")
+    logger.handlers = [collector]
+    logger.setLevel(logging.ERROR)
+    logger.propagate = False
+
+    processor = StructureProcessor(output_directory, logger, **processor_options)
+    processor.create_entries(entries)
+    return processor.stats, collector.messages
+
+
+class ShardedGenerator:
+    """
+    Generates the entries of a spec in parallel, one worker process per shard.
+    """
+
+    def __init__(
+        self,
+        output_directory: Path,
+        logger: logging.Logger,
+        workers: int,
+        depth: int = 1,
+        processor_options: dict = None,
+    ):
+        """
+        Initializes the ShardedGenerator.
+
+        Args:
+            output_directory (Path): The root directory the structure is generated in.
+            logger (logging.Logger): Logger for the final report.
+            workers (int): Number of worker processes, and shards.
+            depth (int): Depth at which the spec is split into subtrees.
+            processor_options (dict, optional): Keyword arguments for StructureProcessor.
+        """
+        self.output_directory = output_directory
+        self.logger = logger
+        self.workers = workers
+        self.depth = depth
+        self.processor_options = dict(processor_options or {})
+
+    def generate(self, entries: list[SpecEntry]) -> ProcessingStats:
+        """
+        Generates the entries and reports the merged statistics and errors.
+
+        Shared directories are created first so the workers can fill them in; their
+        files, metadata and an "end" durability flush are handled once all workers
+        are done.
+
+        Args:
+            entries (list[SpecEntry]): The entries of a spec in file order.
+
+        Returns:
+            ProcessingStats: The merged counts of all shards.
+        """
+        shared, subtrees = split_entries(entries, self.depth)
+        shards = balance_subtrees(subtrees, self.workers)
+        self.logger.info(
+            f"Generating {len(entries)} entries in {len(shards)} shard(s) "
+            f"({', '.join(str(len(shard)) for shard in shards)} entries)."
+        )
+
+        for entry in shared:
+            if entry.is_dir:
+                (self.output_directory / entry.path).mkdir(parents=True, exist_ok=True)
+
+        worker_options = dict(self.processor_options)
+        if worker_options.get("durability") == "end":
+            worker_options.pop("durability")
+
+        stats = ProcessingStats()
+        with ProcessPoolExecutor(max_workers=self.workers) as executor:
+            futures = [
+                executor.submit(
+                    generate_shard, self.output_directory, shard, worker_options
+                )
+                for shard in shards
+            ]
+            for future in futures:
+                try:
+                    shard_stats, errors = future.result()
+                except Exception as e:
+                    self.logger.error(f"Shard failed: {e}")
+                    stats.errors += 1
+                    continue
+                stats.merge(shard_stats)
+                for error in errors:
+                    self.logger.error(error)
+
+        processor = StructureProcessor(
+            self.output_directory, self.logger, **self.processor_options
+        )
+        processor.create_entries(shared)
+        stats.merge(processor.stats)
+
+        self.logger.info(
+            f"Sharded generation finished: {stats.directories} directories, "
+            f"{stats.files} files, {stats.errors} errors."
+        )
+        return stats
@@ -17,8 +17,162 @@ folders and files based on the hierarchy defined in the input file.
 Author: Jonas Zeihe
 """
 
+from dataclasses import dataclass, field
+from datetime import datetime
 from pathlib import Path
+from typing import Iterable, Iterator, Optional
+import hashlib
 import logging
+import os
+import re
+import stat
+from structra.journal import GenerationJournal
+
+DURABILITY_LEVELS = ("none", "end", "dirs")
+METADATA_PATTERN = re.compile(r"^(?P<name>.*?)\s+\{(?P<metadata>[^{}]*)\}$")
+METADATA_KEYS = ("mode", "mtime")
+
+
+def parse_mode(value: str) -> int:
+    """
+    Parses an octal permission mode such as "755" or "0o644".
+
+    Args:
+        value (str): The mode to parse.
+
+    Returns:
+        int: The permission bits.
+
+    Raises:
+        ValueError: If the value is not a valid octal mode.
+    """
+    mode = int(value, 8)
+    if not 0 <= mode <= 0o7777:
+        raise ValueError(f"mode out of range: {value}")
+    return mode
+
+
+def parse_timestamp(value: str) -> float:
+    """
+    Parses a timestamp given as seconds since the epoch or in ISO 8601 format.
+
+    Args:
+        value (str): The timestamp to parse.
+
+    Returns:
+        float: Seconds since the epoch.
+
+    Raises:
+        ValueError: If the value is not a valid timestamp.
+    """
+    try:
+        return float(value)
+    except ValueError:
+        return datetime.fromisoformat(value).timestamp()
+
+
+def split_metadata(clean_line: str) -> tuple[str, dict, list[str]]:
+    """
+    Splits a trailing metadata block such as "{mode=644}" off a cleaned line.
+
+    The block is only recognized if every item in it is a "mode=" or "mtime="
+    pair; otherwise the braces are part of the name, as in "notes {draft}".
+
+    Args:
+        clean_line (str): The cleaned line.
+
+    Returns:
+        tuple[str, dict, list[str]]: The entry name, the parsed metadata keyword
+        arguments and a description of every invalid metadata item.
+    """
+    if not clean_line.endswith("}"):
+        return clean_line, {}, []
+    match = METADATA_PATTERN.match(clean_line)
+    if not match:
+        return clean_line, {}, []
+
+    items = [
+        item.partition("=")
+        for item in match.group("metadata").replace(",", " ").split()
+    ]
+    if not items or any(not sep or key not in METADATA_KEYS for key, sep, _ in items):
+        return clean_line, {}, []
+
+    metadata = {}
+    errors = []
+    for key, _, value in items:
+        try:
+            if key == "mode":
+                metadata["mode"] = parse_mode(value)
+            else:
+                metadata["mtime"] = parse_timestamp(value)
+        except ValueError:
+            errors.append(f"Invalid {key} '{value}'")
+    return match.group("name"), metadata, errors
+
+
+@dataclass
+class ProcessingStats:
+    """
+    Counts of the work done by a StructureProcessor.
+
+    Attributes:
+        directories (int): Directories created or confirmed to exist.
+        files (int): Files created or confirmed to exist.
+        removed (int): Folders and files removed.
+        errors (int): Errors logged while processing.
+    """
+
+    directories: int = 0
+    files: int = 0
+    removed: int = 0
+    errors: int = 0
+
+    @property
+    def entries(self) -> int:
+        """
+        int: Directories and files created or confirmed to exist.
+        """
+        return self.directories + self.files
+
+    def merge(self, other: "ProcessingStats") -> None:
+        """
+        Adds the counts of another ProcessingStats to this one.
+
+        Args:
+            other (ProcessingStats): The counts to add.
+        """
+        self.directories += other.directories
+        self.files += other.files
+        self.removed += other.removed
+        self.errors += other.errors
+
+
+@dataclass(frozen=True)
+class SpecEntry:
+    """
+    A single parsed entry of a PBS file.
+
+    Attributes:
+        path (str): Path relative to the output directory, using "/" as separator.
+        is_dir (bool): True if the entry describes a directory.
+        line_number (int): The line of the PBS file the entry was parsed from.
+        mode (int, optional): Permission bits to apply to the entry.
+        mtime (float, optional): Access and modification time to apply to the entry.
+    """
+
+    path: str
+    is_dir: bool
+    line_number: int = field(default=0, compare=False)
+    mode: Optional[int] = None
+    mtime: Optional[float] = None
+
+    @property
+    def key(self) -> tuple[str, bool]:
+        """
+        tuple[str, bool]: Identifies the entry on disk, ignoring its metadata.
+        """
+        return self.path, self.is_dir
 
 
 class StructureProcessor:
@@ -27,16 +181,44 @@ class StructureProcessor:
     to the hierarchy defined in the input file.
     """
 
-    def __init__(self, output_directory: Path, logger: logging.Logger):
+    def __init__(
+        self,
+        output_directory: Path,
+        logger: logging.Logger,
+        dir_mode: Optional[int] = None,
+        file_mode: Optional[int] = None,
+        mtime: Optional[float] = None,
+        durability: str = "none",
+        resume: bool = False,
+        checkpoint_interval: int = 1000,
+    ):
         """
         Initializes the StructureProcessor with the output directory and logger.
 
         Args:
             output_directory (Path): The root directory where the structure will be generated.
             logger (logging.Logger): Logger for logging messages and errors.
+            dir_mode (int, optional): Default permission bits for directories.
+            file_mode (int, optional): Default permission bits for files.
+            mtime (float, optional): Default access and modification time for all entries.
+            durability (str): How created entries are flushed to disk: "none" leaves it
+                to the operating system, "end" syncs the filesystems once after all
+                entries are created, "dirs" fsyncs every created directory.
+            resume (bool): If True, PBS files are generated with a checkpoint journal
+                and an interrupted generation continues from its last checkpoint.
+            checkpoint_interval (int): Number of entries between two checkpoints.
         """
+        if durability not in DURABILITY_LEVELS:
+            raise ValueError(f"Unknown durability level: {durability}")
         self.output_directory = output_directory
         self.logger = logger
+        self.dir_mode = dir_mode
+        self.file_mode = file_mode
+        self.mtime = mtime
+        self.durability = durability
+        self.resume = resume
+        self.checkpoint_interval = checkpoint_interval
+        self.stats = ProcessingStats()
 
     def process_pbs_file(self, pbs_file_path: Path) -> None:
         """
@@ -47,34 +229,222 @@ class StructureProcessor:
         """
         try:
             lines = self._read_pbs_file(pbs_file_path)
+            if self.resume:
+                self._create_entries_resumable(pbs_file_path, lines)
+            else:
+                self.create_entries(self.iter_entries(lines))
+
+        except FileNotFoundError:
+            self.logger.error(f"PBS file '{pbs_file_path}' not found.")
+            self.stats.errors += 1
+        except OSError as e:
+            self.logger.error(f"Error processing PBS file '{pbs_file_path}': {e}")
+            self.stats.errors += 1
+
+    def process_pbs_stream(
+        self, stream: Iterable[str], source_name: str = "<stdin>"
+    ) -> None:
+        """
+        Processes a PBS structure read incrementally from a stream.
+
+        Entries are created as soon as their lines arrive, so a producer writing
+        into the stream runs concurrently with the generation.
+
+        Args:
+            stream (Iterable[str]): The stream yielding the lines of the PBS structure.
+            source_name (str): Name of the stream used in log messages.
+        """
+        self.logger.info(f"Reading PBS structure from {source_name}")
+        try:
+            self.create_entries(self.iter_entries(stream))
+        except OSError as e:
+            self.logger.error(f"Error processing PBS structure from {source_name}: {e}")
+            self.stats.errors += 1
+
+    def load_pbs_file(self, pbs_file_path: Path) -> list[SpecEntry]:
+        """
+        Reads and parses a PBS file without creating anything.
+
+        Args:
+            pbs_file_path (Path): The path to the PBS file.
+
+        Returns:
+            list[SpecEntry]: The parsed entries in file order.
+        """
+        return self.parse_pbs_lines(self._read_pbs_file(pbs_file_path))
+
+    def parse_pbs_lines(self, lines: Iterable[str]) -> list[SpecEntry]:
+        """
+        Parses the lines of a PBS file into a list of entries.
+
+        Args:
+            lines (Iterable[str]): The lines of the PBS file.
+
+        Returns:
+            list[SpecEntry]: The parsed entries in file order.
+        """
+        return list(self.iter_entries(lines))
+
+    def iter_entries(self, lines: Iterable[str]) -> Iterator[SpecEntry]:
+        """
+        Lazily parses the lines of a PBS file into entries.
+
+        The first non-empty line defines the root folder; every following line is
+        resolved against the path stack built from the preceding directories. A line
+        may end with a metadata block such as "{mode=644 mtime=2024-01-01T00:00:00}".
+
+        Args:
+            lines (Iterable[str]): The lines of the PBS file.
+
+        Yields:
+            SpecEntry: The parsed entries in file order.
+        """
+        root_folder = None
+        path_stack: list[str] = []
+
+        for line_number, line in enumerate(lines, start=1):
+            clean_line = self._clean_line(line)
+            if not clean_line:
+                continue
+
+            clean_line, metadata = self._split_metadata(clean_line, line_number)
+
+            if root_folder is None:
+                root_folder = self._get_root_folder(clean_line)
+                path_stack.append(root_folder)
+                yield SpecEntry(root_folder, True, line_number, **metadata)
+                continue
+
+            if clean_line == root_folder:
+                continue
 
-            root_folder = self._get_root_folder(lines[0])
-            root_path = self.output_directory / root_folder
-            self._create_directory(root_path)
+            level = self._count_hierarchy_level(line)
+            self._adjust_path_stack(path_stack, level)
 
-            path_stack = [root_path]
+            entry_path = f"{path_stack[-1]}/{clean_line.rstrip('/')}"
 
-            for line in lines[1:]:
-                clean_line = self._clean_line(line)
+            if clean_line.endswith("/"):
+                yield SpecEntry(entry_path, True, line_number, **metadata)
+                path_stack.append(entry_path)
+            else:
+                yield SpecEntry(entry_path, False, line_number, **metadata)
 
-                if clean_line == root_folder:
+    def create_entries(
+        self,
+        entries: Iterable[SpecEntry],
+        journal: Optional[GenerationJournal] = None,
+    ) -> None:
+        """
+        Creates the folders and files described by the given entries.
+
+        File metadata is applied as each file is created. Directory metadata is
+        applied once all entries exist, deepest first, so that creating children
+        neither fails on a read-only mode nor bumps an applied timestamp. Finally the
+        created entries are flushed according to the durability level.
+
+        With a journal, the entries completed before its checkpoint are skipped and
+        progress is recorded as entries are created; the journal is completed once
+        everything is created and flushed. The checkpoint stops advancing at the first
+        entry that fails, so a resumed run retries it.
+
+        Args:
+            entries (Iterable[SpecEntry]): The entries to create, parents before children.
+            journal (GenerationJournal, optional): Journal to resume from and record to.
+        """
+        pending_directories = []
+        created_directories = []
+        resume_index = journal.resume_index if journal else 0
+        failed = False
+        for index, entry in enumerate(entries):
+            full_path = self.output_directory / entry.path
+            errors = self.stats.errors
+            if entry.is_dir:
+                mode = entry.mode if entry.mode is not None else self.dir_mode
+                mtime = entry.mtime if entry.mtime is not None else self.mtime
+                if mode is not None or mtime is not None:
+                    pending_directories.append((full_path, mode, mtime))
+                # Directories made by an interrupted run never reached its fsync.
+                if self.durability == "dirs":
+                    created_directories.append(full_path)
+                if index < resume_index:
                     continue
+                self._create_directory(full_path, mode)
+            elif index >= resume_index:
+                mode = entry.mode if entry.mode is not None else self.file_mode
+                mtime = entry.mtime if entry.mtime is not None else self.mtime
+                self._create_file(full_path, mode, mtime)
 
-                level = self._count_hierarchy_level(line)
-                self._adjust_path_stack(path_stack, level)
+            failed = failed or self.stats.errors > errors
+            if journal and not failed:
+                journal.record(index + 1)
 
-                full_path = path_stack[-1] / clean_line.rstrip("/")
+        for full_path, mode, mtime in reversed(pending_directories):
+            self._apply_directory_metadata(full_path, mode, mtime)
 
-                if clean_line.endswith("/"):
-                    self._create_directory(full_path)
-                    path_stack.append(full_path)
-                else:
-                    self._create_file(full_path)
+        if self.durability == "end":
+            self._sync_filesystems()
+        elif self.durability == "dirs" and created_directories:
+            created_directories.append(self.output_directory)
+            self._fsync_directories(reversed(created_directories))
 
-        except FileNotFoundError:
-            self.logger.error(f"PBS file '{pbs_file_path}' not found.")
-        except OSError as e:
-            self.logger.error(f"Error processing PBS file '{pbs_file_path}': {e}")
+        if journal:
+            journal.complete()
+
+    def remove_entries(self, entries: Iterable[SpecEntry]) -> None:
+        """
+        Removes the folders and files described by the given entries.
+
+        Entries are removed deepest first. Directories are only removed when they
+        are empty, so content that is not described by the entries is preserved.
+
+        Args:
+            entries (Iterable[SpecEntry]): The entries to remove.
+        """
+        for entry in sorted(entries, key=lambda e: e.path.count("/"), reverse=True):
+            self._remove_entry(entry)
+
+    def _create_entries_resumable(self, pbs_file_path: Path, lines: list[str]) -> None:
+        """
+        Creates the entries of a PBS file, resuming from and recording to its journal.
+
+        Args:
+            pbs_file_path (Path): The path to the PBS file.
+            lines (list[str]): The lines of the PBS file.
+        """
+        spec_digest = hashlib.sha256("".join(lines).encode("utf-8")).hexdigest()
+        self.output_directory.mkdir(parents=True, exist_ok=True)
+        journal = GenerationJournal(
+            self._journal_path(pbs_file_path),
+            spec_digest,
+            self.logger,
+            self.checkpoint_interval,
+        )
+        journal.open()
+        try:
+            self.create_entries(self.iter_entries(lines), journal)
+        finally:
+            journal.close()
+
+    def _journal_path(self, pbs_file_path: Path) -> Path:
+        """
+        Returns the journal path for a PBS file.
+
+        The name includes a hash of the resolved path, so specs with the same file
+        name in different folders keep separate journals.
+
+        Args:
+            pbs_file_path (Path): The path to the PBS file.
+
+        Returns:
+            Path: The journal path inside the output directory.
+        """
+        path_digest = hashlib.sha256(
+            str(pbs_file_path.resolve()).encode("utf-8")
+        ).hexdigest()[:12]
+        return (
+            self.output_directory
+            / f".structra_{pbs_file_path.stem}_{path_digest}.journal"
+        )
 
     def _read_pbs_file(self, pbs_file_path: Path) -> list[str]:
         """
@@ -102,38 +472,192 @@ class StructureProcessor:
         """
         return first_line.strip().rstrip("/")
 
-    def _create_directory(self, directory_path: Path) -> None:
+    def _split_metadata(self, clean_line: str, line_number: int) -> tuple[str, dict]:
+        """
+        Splits a trailing metadata block off a cleaned line, logging invalid items.
+
+        Args:
+            clean_line (str): The cleaned line.
+            line_number (int): The line number, used in error messages.
+
+        Returns:
+            tuple[str, dict]: The entry name and the parsed metadata keyword arguments.
+        """
+        name, metadata, errors = split_metadata(clean_line)
+        for error in errors:
+            self.logger.error(f"{error} on line {line_number}.")
+            self.stats.errors += 1
+        return name, metadata
+
+    def _create_directory(
+        self, directory_path: Path, mode: Optional[int] = None
+    ) -> None:
         """
         Creates a directory if it doesn't exist.
 
         Args:
             directory_path (Path): The path to the directory.
+            mode (int, optional): Permission bits for a new directory. The owner keeps
+                full access until the final mode is applied.
         """
         try:
-            directory_path.mkdir(parents=True, exist_ok=True)
+            if mode is None:
+                directory_path.mkdir(parents=True, exist_ok=True)
+            else:
+                directory_path.mkdir(mode | stat.S_IRWXU, parents=True, exist_ok=True)
             self.logger.info(f"Directory created: {directory_path}")
+            self.stats.directories += 1
         except OSError as e:
             self.logger.error(f"Failed to create directory '{directory_path}': {e}")
-
-    def _create_file(self, file_path: Path) -> None:
+            self.stats.errors += 1
+
+    def _create_file(
+        self,
+        file_path: Path,
+        mode: Optional[int] = None,
+        mtime: Optional[float] = None,
+    ) -> None:
         """
         Creates an empty file if it doesn't exist.
 
         Args:
             file_path (Path): The path to the file.
+            mode (int, optional): Permission bits to apply to the file.
+            mtime (float, optional): Access and modification time to apply to the file.
         """
         try:
-            file_path.touch(exist_ok=True)
+            if mode is None and mtime is None:
+                file_path.touch(exist_ok=True)
+            else:
+                create_mode = 0o666 if mode is None else mode
+                fd = os.open(file_path, os.O_RDONLY | os.O_CREAT, create_mode)
+                try:
+                    self._apply_metadata(file_path, fd, mode, mtime)
+                finally:
+                    os.close(fd)
             self.logger.info(f"File created: {file_path}")
+            self.stats.files += 1
         except OSError as e:
             self.logger.error(f"Failed to create file '{file_path}': {e}")
+            self.stats.errors += 1
+
+    def _apply_directory_metadata(
+        self, directory_path: Path, mode: Optional[int], mtime: Optional[float]
+    ) -> None:
+        """
+        Applies permission bits and timestamps to an existing directory.
+
+        Args:
+            directory_path (Path): The path to the directory.
+            mode (int, optional): Permission bits to apply.
+            mtime (float, optional): Access and modification time to apply.
+        """
+        try:
+            if os.name == "nt":
+                self._apply_metadata(directory_path, None, mode, mtime)
+                return
+            fd = os.open(directory_path, os.O_RDONLY)
+            try:
+                self._apply_metadata(directory_path, fd, mode, mtime)
+            finally:
+                os.close(fd)
+        except OSError as e:
+            self.logger.error(f"Failed to apply metadata to '{directory_path}': {e}")
+            self.stats.errors += 1
+
+    def _apply_metadata(
+        self,
+        path: Path,
+        fd: Optional[int],
+        mode: Optional[int],
+        mtime: Optional[float],
+    ) -> None:
+        """
+        Applies permission bits and timestamps, through the open descriptor if possible.
+
+        Args:
+            path (Path): The path of the entry, used where descriptors are unsupported.
+            fd (int, optional): An open descriptor of the entry.
+            mode (int, optional): Permission bits to apply.
+            mtime (float, optional): Access and modification time to apply.
+        """
+        if mode is not None:
+            if fd is not None and hasattr(os, "fchmod"):
+                os.fchmod(fd, mode)
+            else:
+                os.chmod(path, mode)
+        if mtime is not None:
+            target = fd if fd is not None and os.utime in os.supports_fd else path
+            os.utime(target, (mtime, mtime))
+
+    def _sync_filesystems(self) -> None:
+        """
+        Flushes all pending writes of the operating system to disk in one call.
+        """
+        if not hasattr(os, "sync"):
+            self.logger.warning(
+                "Durability level 'end' is not supported on this platform."
+            )
+            return
+        os.sync()
+        self.logger.info("Filesystems synced.")
+
+    def _fsync_directories(self, directory_paths: Iterable[Path]) -> None:
+        """
+        Flushes the given directories, and with them the entries they contain, to disk.
+
+        Args:
+            directory_paths (Iterable[Path]): The directories to flush, children first.
+        """
+        if os.name == "nt":
+            self.logger.warning(
+                "Durability level 'dirs' is not supported on this platform."
+            )
+            return
+
+        synced = 0
+        for directory_path in directory_paths:
+            try:
+                fd = os.open(directory_path, os.O_RDONLY)
+                try:
+                    os.fsync(fd)
+                finally:
+                    os.close(fd)
+                synced += 1
+            except OSError as e:
+                self.logger.error(f"Failed to sync directory '{directory_path}': {e}")
+                self.stats.errors += 1
+        self.logger.info(f"{synced} directories synced.")
+
+    def _remove_entry(self, entry: SpecEntry) -> None:
+        """
+        Removes the folder or file described by a single entry.
+
+        Args:
+            entry (SpecEntry): The entry to remove.
+        """
+        full_path = self.output_directory / entry.path
+        try:
+            if entry.is_dir:
+                full_path.rmdir()
+                self.logger.info(f"Directory removed: {full_path}")
+                self.stats.removed += 1
+            else:
+                full_path.unlink()
+                self.logger.info(f"File removed: {full_path}")
+                self.stats.removed += 1
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            self.logger.error(f"Failed to remove '{full_path}': {e}")
+            self.stats.errors += 1
 
-    def _adjust_path_stack(self, path_stack: list[Path], level: int) -> None:
+    def _adjust_path_stack(self, path_stack: list, level: int) -> None:
         """
         Adjusts the path stack based on the hierarchy level.
 
         Args:
-            path_stack (list[Path]): The stack of paths representing the current directory structure.
+            path_stack (list): The stack of paths representing the current directory structure.
             level (int): The current hierarchy level.
         """
         while len(path_stack) > level + 1:
@@ -0,0 +1,202 @@
+# -----------------------------------------------------------------------------
+# Structra - A tool to generate folder and file structures based on input text files
+#
+# Copyright (c) 2024 Jonas Zeihe
+# Licensed under the MIT License. See LICENSE file in the project root for details.
+#
+# Project URL: https://github.com/jonaszeihe/structra
+# Contact: JonasZeihe@gmail.com
+# -----------------------------------------------------------------------------
+
+# syncer.py
+
+"""
+Prunes folders and files that are not described by the Project Structure (PBS) files.
+
+The root folders declared by the specs are scanned with os.scandir. Every entry on
+disk that is absent from the specs is removed together with its subtree, so the cost
+of a sync is proportional to the drift rather than to the size of the whole tree.
+
+Author: Jonas Zeihe
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Iterable, Optional
+import logging
+import os
+import shutil
+from structra.structure_processor import ProcessingStats, SpecEntry
+
+
+class StructureSyncer:
+    """
+    Removes entries from the output directory that are not declared by the specs.
+    """
+
+    def __init__(
+        self,
+        output_directory: Path,
+        logger: logging.Logger,
+        max_deletions: int = 1000,
+        workers: Optional[int] = None,
+        batch_size: int = 256,
+    ):
+        """
+        Initializes the StructureSyncer.
+
+        Args:
+            output_directory (Path): The root directory the structure is generated in.
+            logger (logging.Logger): Logger for logging messages and errors.
+            max_deletions (int): Refuse to sync if more entries would be removed.
+            workers (int, optional): Number of removal threads. Defaults to None.
+            batch_size (int): Number of drifted subtrees handed to a thread at once.
+        """
+        self.output_directory = output_directory
+        self.logger = logger
+        self.max_deletions = max_deletions
+        self.workers = workers
+        self.batch_size = batch_size
+        self.stats = ProcessingStats()
+
+    def find_drift(self, entries: Iterable[SpecEntry]) -> tuple[list[SpecEntry], int]:
+        """
+        Scans the declared root folders for entries that are absent from the specs.
+
+        An absent directory is reported once and not descended into; its contents
+        only contribute to the deletion count.
+
+        Args:
+            entries (Iterable[SpecEntry]): The entries declared by the specs.
+
+        Returns:
+            tuple[list[SpecEntry], int]: The drifted entries, which never contain one
+            another, and the total number of filesystem entries they cover.
+        """
+        expected = {entry.key for entry in entries}
+        roots = [path for path, _ in expected if "/" not in path]
+
+        drift: list[SpecEntry] = []
+        deletions = 0
+        stack = [root for root in roots if (self.output_directory / root).is_dir()]
+
+        while stack:
+            relative_dir = stack.pop()
+            with os.scandir(self.output_directory / relative_dir) as iterator:
+                for dir_entry in iterator:
+                    relative_path = f"{relative_dir}/{dir_entry.name}"
+                    is_dir = dir_entry.is_dir(follow_symlinks=False)
+                    if (relative_path, is_dir) in expected:
+                        if is_dir:
+                            stack.append(relative_path)
+                        continue
+
+                    drift.append(SpecEntry(relative_path, is_dir))
+                    deletions += 1
+                    if is_dir:
+                        deletions += self._count_subtree(dir_entry.path)
+
+        return drift, deletions
+
+    def sync(
+        self, entries: Iterable[SpecEntry], dry_run: bool = False
+    ) -> Optional[int]:
+        """
+        Removes every entry on disk that is absent from the specs.
+
+        Removed entries and failed removals are counted in the syncer's stats.
+
+        Args:
+            entries (Iterable[SpecEntry]): The entries declared by the specs.
+            dry_run (bool): If True, only list what would be removed.
+
+        Returns:
+            int | None: The number of drifted entries removed (or listed in a dry run),
+            or None if the sync was aborted because it exceeds the deletion limit.
+        """
+        drift, deletions = self.find_drift(entries)
+        if not drift:
+            self.logger.info("Output directory is already in sync.")
+            return 0
+
+        if dry_run:
+            for entry in drift:
+                self.logger.info(f"Would remove: {self.output_directory / entry.path}")
+            self.logger.info(f"Dry run: {deletions} entries would be removed.")
+            if deletions > self.max_deletions:
+                self.logger.warning(
+                    f"A real sync would be aborted: {deletions} entries exceed the "
+                    f"limit of {self.max_deletions}. Use --max-deletions to raise it."
+                )
+            return len(drift)
+
+        if deletions > self.max_deletions:
+            self.logger.error(
+                f"Sync aborted: {deletions} entries would be removed, exceeding the "
+                f"limit of {self.max_deletions}. Use --max-deletions to raise it."
+            )
+            return None
+
+        batches = [
+            drift[start : start + self.batch_size]
+            for start in range(0, len(drift), self.batch_size)
+        ]
+        stats = ProcessingStats()
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            for batch_stats in executor.map(self._remove_batch, batches):
+                stats.merge(batch_stats)
+        self.stats.merge(stats)
+
+        if stats.errors:
+            self.logger.error(f"Sync failed to remove {stats.errors} entries.")
+        else:
+            self.logger.info(f"Sync removed {deletions} entries.")
+        return stats.removed
+
+    def _remove_batch(self, batch: list[SpecEntry]) -> ProcessingStats:
+        """
+        Removes a batch of drifted entries.
+
+        Args:
+            batch (list[SpecEntry]): Drifted entries; directories are removed bottom-up.
+
+        Returns:
+            ProcessingStats: The number of entries removed and of failed removals.
+        """
+        stats = ProcessingStats()
+        for entry in batch:
+            full_path = self.output_directory / entry.path
+            try:
+                if entry.is_dir:
+                    shutil.rmtree(full_path)
+                    self.logger.info(f"Directory removed: {full_path}")
+                else:
+                    full_path.unlink()
+                    self.logger.info(f"File removed: {full_path}")
+                stats.removed += 1
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                self.logger.error(f"Failed to remove '{full_path}': {e}")
+                stats.errors += 1
+        return stats
+
+    def _count_subtree(self, directory: str) -> int:
+        """
+        Counts the filesystem entries below a directory.
+
+        Args:
+            directory (str): The directory to count.
+
+        Returns:
+            int: The number of entries below the directory.
+        """
+        count = 0
+        stack = [directory]
+        while stack:
+            with os.scandir(stack.pop()) as iterator:
+                for dir_entry in iterator:
+                    count += 1
+                    if dir_entry.is_dir(follow_symlinks=False):
+                        stack.append(dir_entry.path)
+        return count
@@ -0,0 +1,216 @@
+# -----------------------------------------------------------------------------
+# Structra - A tool to generate folder and file structures based on input text files
+#
+# Copyright (c) 2024 Jonas Zeihe
+# Licensed under the MIT License. See LICENSE file in the project root for details.
+#
+# Project URL: https://github.com/jonaszeihe/structra
+# Contact: JonasZeihe@gmail.com
+# -----------------------------------------------------------------------------
+
+# watcher.py
+
+"""
+Watches Project Structure (PBS) files for changes and re-applies them incrementally.
+
+The parsed entries of every spec are kept in memory. Specs are polled cheaply by
+modification time and size first and by content hash second; on a real change only
+the difference between the old and the new entries is applied to the output directory.
+
+Author: Jonas Zeihe
+"""
+
+from pathlib import Path
+import hashlib
+import logging
+import time
+from typing import Optional
+from structra.structure_processor import SpecEntry, StructureProcessor
+
+
+def diff_entries(
+    old_entries: list[SpecEntry], new_entries: list[SpecEntry]
+) -> tuple[list[SpecEntry], list[SpecEntry]]:
+    """
+    Computes the entries added and removed between two parses of a spec.
+
+    An entry whose metadata changed is reported as added so it is re-applied, but
+    not as removed.
+
+    Args:
+        old_entries (list[SpecEntry]): Entries of the previous parse.
+        new_entries (list[SpecEntry]): Entries of the current parse.
+
+    Returns:
+        tuple[list[SpecEntry], list[SpecEntry]]: The added entries in spec order and
+        the removed entries.
+    """
+    old_set = set(old_entries)
+    new_keys = {entry.key for entry in new_entries}
+    added = [entry for entry in new_entries if entry not in old_set]
+    removed = [entry for entry in old_entries if entry.key not in new_keys]
+    return added, removed
+
+
+class _SpecState:
+    """
+    In-memory state of a single watched spec.
+    """
+
+    def __init__(self, spec_path: Path):
+        self.spec_path = spec_path
+        self.signature = None
+        self.digest = None
+        self.pending_digest = None
+        self.entries: list[SpecEntry] = []
+
+
+class SpecWatcher:
+    """
+    Polls PBS files and applies changes to the generated structure incrementally.
+    """
+
+    def __init__(
+        self,
+        spec_paths: list[Path],
+        processor: StructureProcessor,
+        logger: logging.Logger,
+        poll_interval: float = 1.0,
+        prune: bool = False,
+    ):
+        """
+        Initializes the SpecWatcher.
+
+        Args:
+            spec_paths (list[Path]): The PBS files to watch.
+            processor (StructureProcessor): Processor used to create and remove entries.
+            logger (logging.Logger): Logger for logging messages and errors.
+            poll_interval (float): Seconds to wait between two polls. Default is 1.0.
+            prune (bool): If True, entries removed from a spec are removed from disk.
+        """
+        self.processor = processor
+        self.logger = logger
+        self.poll_interval = poll_interval
+        self.prune = prune
+        self._states = [_SpecState(path) for path in spec_paths]
+
+    def poll(self) -> int:
+        """
+        Checks every watched spec once and applies the changes found.
+
+        Returns:
+            int: The number of specs that changed.
+        """
+        changed = 0
+        for state in self._states:
+            if self._refresh(state):
+                changed += 1
+        return changed
+
+    def run(self, max_polls: Optional[int] = None) -> None:
+        """
+        Polls the watched specs until interrupted.
+
+        Args:
+            max_polls (int, optional): Stop after this many polls. Defaults to None.
+        """
+        self.logger.info(
+            f"Watching {len(self._states)} spec file(s). Press Ctrl+C to stop."
+        )
+        polls = 0
+        try:
+            while max_polls is None or polls < max_polls:
+                self.poll()
+                polls += 1
+                if max_polls is None or polls < max_polls:
+                    time.sleep(self.poll_interval)
+        except KeyboardInterrupt:
+            self.logger.info("Watch mode stopped.")
+
+    def _refresh(self, state: _SpecState) -> bool:
+        """
+        Re-reads a spec if it changed and applies the difference to disk.
+
+        The state is only updated once the spec was read and parsed successfully,
+        so a failed read is retried on the next poll. When pruning, a change that
+        removes entries is only applied once two consecutive polls read the same
+        content, so a spec caught half-written does not delete anything.
+
+        Args:
+            state (_SpecState): The state of the spec to refresh.
+
+        Returns:
+            bool: True if the spec content changed.
+        """
+        try:
+            stat_result = state.spec_path.stat()
+        except FileNotFoundError:
+            self.logger.error(f"PBS file '{state.spec_path}' not found.")
+            return False
+
+        signature = (stat_result.st_mtime_ns, stat_result.st_size)
+        if signature == state.signature:
+            return False
+
+        try:
+            content = state.spec_path.read_bytes()
+        except OSError as e:
+            self.logger.error(f"Error reading PBS file '{state.spec_path}': {e}")
+            return False
+
+        digest = hashlib.sha256(content).digest()
+        if digest == state.digest:
+            state.signature = signature
+            state.pending_digest = None
+            return False
+
+        try:
+            lines = content.decode("utf-8").splitlines()
+            new_entries = self.processor.parse_pbs_lines(lines)
+        except ValueError as e:
+            self.logger.error(f"Error parsing PBS file '{state.spec_path}': {e}")
+            return False
+
+        added, removed = diff_entries(state.entries, new_entries)
+        if self.prune and removed and digest != state.pending_digest:
+            self.logger.info(
+                f"Spec '{state.spec_path}' removes {len(removed)} entries, "
+                "waiting for the next poll to confirm."
+            )
+            state.pending_digest = digest
+            return False
+
+        state.signature = signature
+        state.digest = digest
+        state.pending_digest = None
+        state.entries = new_entries
+
+        self.logger.info(
+            f"Spec '{state.spec_path}' changed: "
+            f"{len(added)} added, {len(removed)} removed."
+        )
+        if self.prune and removed:
+            self.processor.remove_entries(self._unclaimed(removed, state))
+        self.processor.create_entries(added)
+        return True
+
+    def _unclaimed(
+        self, entries: list[SpecEntry], owner: _SpecState
+    ) -> list[SpecEntry]:
+        """
+        Filters out entries that are still declared by another watched spec.
+
+        Args:
+            entries (list[SpecEntry]): Entries removed from the owning spec.
+            owner (_SpecState): The spec the entries were removed from.
+
+        Returns:
+            list[SpecEntry]: The entries no watched spec declares anymore.
+        """
+        claimed = {
+            entry.key
+            for state in self._states
+            if state is not owner
+            for entry in state.entries
+        }
+        return [entry for entry in entries if entry.key not in claimed]
@@ -0,0 +1,141 @@
+# -----------------------------------------------------------------------------
+# Structra - A tool to generate folder and file structures based on input text files
+#
+# Copyright (c) 2024 Jonas Zeihe
+# Licensed under the MIT License. See LICENSE file in the project root for details.
+#
+# Project URL: https://github.com/jonaszeihe/structra
+# Contact: JonasZeihe@gmail.com
+# -----------------------------------------------------------------------------
+
+# test_api.py
+
+"""
+Unit tests for the in-memory API of the Structra application.
+
+These tests cover generating structures from strings, iterables of lines and
+nested dicts and lists, and the counts returned for each call.
+
+Author: Jonas Zeihe
+"""
+
+import unittest
+import shutil
+import tempfile
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+from structra import (
+    generate_from_lines,
+    generate_from_string,
+    generate_from_structure,
+)
+from structra.api import iter_structure_entries
+from structra.structure_processor import SpecEntry
+
+
+class TestApi(unittest.TestCase):
+    """
+    Tests to ensure in-memory specs are generated without reading any file.
+    """
+
+    def setUp(self):
+        """
+        Set up a temporary output directory.
+        """
+        self.test_dir = Path(tempfile.mkdtemp())
+        self.logger = MagicMock()
+
+    def tearDown(self):
+        """
+        Clean up the temporary directory.
+        """
+        shutil.rmtree(self.test_dir)
+
+    @patch("structra.structure_processor.StructureProcessor._read_pbs_file")
+    def test_generate_from_string(self, mock_read):
+        """
+        Test that a spec string is generated and counted without reading a file.
+        """
+        stats = generate_from_string(
+            "project/\n├── src/\n│   └── main.py\n└── README.md\n",
+            self.test_dir,
+            self.logger,
+        )
+
+        mock_read.assert_not_called()
+        self.assertTrue((self.test_dir / "project/src/main.py").is_file())
+        self.assertEqual((stats.directories, stats.files, stats.errors), (2, 2, 0))
+        self.assertEqual(stats.entries, 4)
+
+    def test_generate_from_lines(self):
+        """
+        Test that an iterable of lines is generated.
+        """
+        lines = (line for line in ["project/", "└── a.txt"])
+
+        stats = generate_from_lines(lines, str(self.test_dir), self.logger)
+
+        self.assertTrue((self.test_dir / "project/a.txt").is_file())
+        self.assertEqual(stats.entries, 2)
+
+    def test_generate_from_structure(self):
+        """
+        Test that a nested structure is generated.
+        """
+        structure = {
+            "project": {
+                "src": ["main.py", "util/", {"data": {}}],
+                "README.md": None,
+            }
+        }
+
+        stats = generate_from_structure(structure, self.test_dir, self.logger)
+
+        self.assertTrue((self.test_dir / "project/src/main.py").is_file())
+        self.assertTrue((self.test_dir / "project/src/util").is_dir())
+        self.assertTrue((self.test_dir / "project/src/data").is_dir())
+        self.assertTrue((self.test_dir / "project/README.md").is_file())
+        self.assertEqual((stats.directories, stats.files), (4, 2))
+
+    def test_iter_structure_entries_metadata(self):
+        """
+        Test that names in a nested structure may carry metadata.
+        """
+        entries = list(iter_structure_entries({"p": ["run.sh {mode=755}"]}))
+
+        self.assertEqual(
+            entries, [SpecEntry("p", True), SpecEntry("p/run.sh", False, mode=0o755)]
+        )
+
+    def test_iter_structure_entries_trailing_slash(self):
+        """
+        Test that names ending in "/" are directories in dicts and with metadata.
+        """
+        entries = list(
+            iter_structure_entries({"p": {"util/": None, "bin/ {mode=755}": None}})
+        )
+
+        self.assertEqual(
+            entries,
+            [
+                SpecEntry("p", True),
+                SpecEntry("p/util", True),
+                SpecEntry("p/bin", True, mode=0o755),
+            ],
+        )
+
+    def test_generate_from_structure_invalid(self):
+        """
+        Test that invalid structures are rejected before anything is created.
+        """
+        with self.assertRaises(TypeError):
+            generate_from_structure(["project/"], self.test_dir, self.logger)
+        with self.assertRaises(TypeError):
+            generate_from_structure({"project": {"a": 1}}, self.test_dir, self.logger)
+        with self.assertRaises(ValueError):
+            generate_from_structure({"p": ["a {mode=9}"]}, self.test_dir, self.logger)
+        self.assertEqual(list(self.test_dir.iterdir()), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,178 @@
+# -----------------------------------------------------------------------------
+# Structra - A tool to generate folder and file structures based on input text files
+#
+# Copyright (c) 2024 Jonas Zeihe
+# Licensed under the MIT License. See LICENSE file in the project root for details.
+#
+# Project URL: https://github.com/jonaszeihe/structra
+# Contact: JonasZeihe@gmail.com
+# -----------------------------------------------------------------------------
+
+# test_journal.py
+
+"""
+Unit tests for the checkpoint journal of the Structra application.
+
+These tests cover writing checkpoints in batches, validating a journal against
+its spec and resuming an interrupted generation.
+
+Author: Jonas Zeihe
+"""
+
+import unittest
+import hashlib
+import os
+import shutil
+import tempfile
+from pathlib import Path
+from unittest.mock import MagicMock, call, patch
+from structra.journal import JOURNAL_HEADER, GenerationJournal
+from structra.structure_processor import SpecEntry, StructureProcessor
+
+
+class TestJournal(unittest.TestCase):
+    """
+    Tests to ensure generation progress is recorded and restored correctly.
+    """
+
+    def setUp(self):
+        """
+        Set up a temporary directory and a logger.
+        """
+        self.test_dir = Path(tempfile.mkdtemp())
+        self.journal_path = self.test_dir / "spec.journal"
+        self.logger = MagicMock()
+
+    def tearDown(self):
+        """
+        Clean up the temporary directory.
+        """
+        shutil.rmtree(self.test_dir)
+
+    def test_checkpoints_are_batched(self):
+        """
+        Test that a checkpoint is only written once per interval.
+        """
+        journal = GenerationJournal(self.journal_path, "abc", self.logger, interval=3)
+        self.assertEqual(journal.open(), 0)
+        for completed in range(1, 8):
+            journal.record(completed)
+        journal.close()
+
+        self.assertEqual(
+            self.journal_path.read_text(encoding="utf-8"),
+            f"{JOURNAL_HEADER} abc\n3\n6\n",
+        )
+
+    def test_resume_from_last_checkpoint(self):
+        """
+        Test that a journal for the same spec resumes from its last full checkpoint.
+        """
+        self.journal_path.write_text(f"{JOURNAL_HEADER} abc\n3\n6\n9", encoding="utf-8")
+        journal = GenerationJournal(self.journal_path, "abc", self.logger)
+
+        self.assertEqual(journal.open(), 6)
+        journal.close()
+
+    def test_journal_for_other_spec_is_discarded(self):
+        """
+        Test that a journal written for a different spec is not resumed.
+        """
+        self.journal_path.write_text(f"{JOURNAL_HEADER} abc\n3\n", encoding="utf-8")
+        journal = GenerationJournal(self.journal_path, "xyz", self.logger)
+
+        self.assertEqual(journal.open(), 0)
+        journal.close()
+        self.assertEqual(
+            self.journal_path.read_text(encoding="utf-8"), f"{JOURNAL_HEADER} xyz\n"
+        )
+
+    def test_complete_deletes_journal(self):
+        """
+        Test that completing the journal removes it.
+        """
+        journal = GenerationJournal(self.journal_path, "abc", self.logger)
+        journal.open()
+        journal.complete()
+
+        self.assertFalse(self.journal_path.exists())
+
+    def test_processor_resumes_generation(self):
+        """
+        Test that a resumed generation skips the entries before the checkpoint.
+        """
+        spec_file = self.test_dir / "spec.txt"
+        content = "project/\n├── a.txt\n├── b.txt\n└── c.txt\n"
+        spec_file.write_text(content, encoding="utf-8")
+        output_dir = self.test_dir / "output"
+        (output_dir / "project").mkdir(parents=True)
+        digest = hashlib.sha256(content.encode("utf-8")).hexdigest()
+        processor = StructureProcessor(output_dir, self.logger, resume=True)
+        journal_path = processor._journal_path(spec_file)
+        journal_path.write_text(f"{JOURNAL_HEADER} {digest}\n2\n", encoding="utf-8")
+
+        processor.process_pbs_file(spec_file)
+
+        self.assertFalse((output_dir / "project/a.txt").exists())
+        self.assertTrue((output_dir / "project/b.txt").exists())
+        self.assertTrue((output_dir / "project/c.txt").exists())
+        self.assertFalse(journal_path.exists())
+        self.assertEqual(processor.stats.files, 2)
+
+    def test_checkpoint_stops_at_failed_entry(self):
+        """
+        Test that the checkpoint does not advance past an entry that failed.
+        """
+        processor = StructureProcessor(self.test_dir, self.logger)
+        journal = MagicMock(resume_index=0)
+
+        processor.create_entries(
+            [
+                SpecEntry("project", True),
+                SpecEntry("project/missing/a.txt", False),
+                SpecEntry("project/b.txt", False),
+            ],
+            journal,
+        )
+
+        self.assertEqual(journal.record.call_args_list, [call(1)])
+        self.assertTrue((self.test_dir / "project/b.txt").exists())
+        self.assertEqual(processor.stats.errors, 1)
+
+    @unittest.skipIf(os.name == "nt", "directory fsync required")
+    @patch("structra.structure_processor.os.fsync")
+    def test_resume_fsyncs_skipped_directories(self, mock_fsync):
+        """
+        Test that durability level "dirs" also flushes directories skipped on resume.
+        """
+        (self.test_dir / "project/src").mkdir(parents=True)
+        processor = StructureProcessor(self.test_dir, self.logger, durability="dirs")
+
+        processor.create_entries(
+            [
+                SpecEntry("project", True),
+                SpecEntry("project/src", True),
+                SpecEntry("project/src/a.txt", False),
+            ],
+            MagicMock(resume_index=2),
+        )
+
+        self.assertEqual(mock_fsync.call_count, 3)
+        self.assertEqual(processor.stats.directories, 0)
+
+    def test_journal_path_depends_on_spec_folder(self):
+        """
+        Test that specs with the same name in different folders get separate journals.
+        """
+        processor = StructureProcessor(self.test_dir, self.logger, resume=True)
+
+        first = processor._journal_path(self.test_dir / "one" / "spec.txt")
+        second = processor._journal_path(self.test_dir / "two" / "spec.txt")
+
+        self.assertNotEqual(first, second)
+        self.assertTrue(first.name.startswith(".structra_spec_"))
+        self.assertEqual(first.parent, self.test_dir)
+
+
+if __name__ == "__main__":
+    unittest.main()
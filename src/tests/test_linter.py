@@ -0,0 +1,138 @@
+# -----------------------------------------------------------------------------
+# Structra - A tool to generate folder and file structures based on input text files
+#
+# Copyright (c) 2024 Jonas Zeihe
+# Licensed under the MIT License. See LICENSE file in the project root for details.
+#
+# Project URL: https://github.com/jonaszeihe/structra
+# Contact: JonasZeihe@gmail.com
+# -----------------------------------------------------------------------------
+
+# test_linter.py
+
+"""
+Unit tests for the check mode of the Structra application.
+
+These tests cover the detection of indentation, duplicate, type, naming and
+metadata problems in PBS files without touching the filesystem.
+
+Author: Jonas Zeihe
+"""
+
+import unittest
+from pathlib import Path
+from unittest.mock import MagicMock
+from structra.linter import SpecLinter, SpecProblem
+from structra.structure_processor import StructureProcessor
+
+
+class TestLinter(unittest.TestCase):
+    """
+    Tests to ensure problems in PBS files are reported with their line numbers.
+    """
+
+    def setUp(self):
+        """
+        Set up a linter with a processor that must never touch the filesystem.
+        """
+        self.processor = StructureProcessor(Path("does-not-exist"), MagicMock())
+        self.linter = SpecLinter(self.processor)
+
+    def _messages(self, lines, linter=None):
+        """
+        Returns the line numbers and messages of all problems found in the lines.
+        """
+        problems = (linter or self.linter).check(lines)
+        return [(problem.line_number, problem.message) for problem in problems]
+
+    def test_valid_spec(self):
+        """
+        Test that a well-formed spec has no problems.
+        """
+        lines = [
+            "project/",
+            "├── src/",
+            "│   ├── main.py {mode=644}",
+            "│   └── util/",
+            "│       └── io.py",
+            "└── README.md",
+        ]
+        self.assertEqual(self.linter.check(lines), [])
+
+    def test_inconsistent_indentation(self):
+        """
+        Test that indentation that is not a multiple of 4 is reported.
+        """
+        lines = ["project/", "├── src/", "│  ├── main.py"]
+        self.assertEqual(
+            self._messages(lines),
+            [(3, "Indentation of 3 is not a multiple of 4.")],
+        )
+
+    def test_skipped_level(self):
+        """
+        Test that a jump of more than one level is reported.
+        """
+        lines = ["project/", "├── src/", "│   │   └── main.py"]
+        self.assertEqual(len(self.linter.check(lines)), 1)
+        self.assertIn("skips a level", self.linter.check(lines)[0].message)
+
+    def test_duplicate_siblings(self):
+        """
+        Test that duplicate and conflicting siblings are reported.
+        """
+        lines = ["project/", "├── a.txt", "├── a.txt", "├── b/", "└── b"]
+        self.assertEqual(
+            self._messages(lines),
+            [
+                (3, "Duplicate entry 'project/a.txt' (first declared on line 2)."),
+                (
+                    5,
+                    "'project/b' is declared as both a file and a directory "
+                    "(first declared on line 4).",
+                ),
+            ],
+        )
+
+    def test_file_used_as_directory(self):
+        """
+        Test that a file with children is reported.
+        """
+        lines = ["project/", "├── a.txt", "│   └── b.txt"]
+        self.assertEqual(
+            self._messages(lines),
+            [(3, "'project/a.txt' is a file but is used as a directory.")],
+        )
+
+    def test_illegal_names(self):
+        """
+        Test that names illegal on Windows are reported in portable mode.
+        """
+        linter = SpecLinter(self.processor, portable=True)
+        lines = ["project/", "├── a:b.txt", "├── CON.txt", "├── trailing.", "└── a/b"]
+        self.assertEqual(
+            [line for line, _ in self._messages(lines, linter)], [2, 3, 4, 5]
+        )
+
+    def test_invalid_metadata(self):
+        """
+        Test that invalid metadata is reported.
+        """
+        lines = ["project/", "└── a.txt {mode=999 mtime=soon}"]
+        self.assertEqual(
+            self._messages(lines),
+            [(2, "Invalid mode '999'."), (2, "Invalid mtime 'soon'.")],
+        )
+
+    def test_empty_spec(self):
+        """
+        Test that a spec without a root folder is reported.
+        """
+        self.assertEqual(
+            self.linter.check(["", "\n"]),
+            [SpecProblem(0, "The spec does not declare a root folder.")],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -25,7 +25,17 @@ import tempfile
 import shutil
 from pathlib import Path
 from unittest.mock import patch, MagicMock
-from structra.main import parse_arguments, validate_files, process_files, main
+from structra.main import (
+    parse_arguments,
+    validate_files,
+    process_files,
+    watch_files,
+    sync_files,
+    get_processor_options,
+    check_files,
+    shard_files,
+    main,
+)
 
 
 class TestMain(unittest.TestCase):
@@ -58,6 +68,65 @@ class TestMain(unittest.TestCase):
         self.assertEqual(parsed_args.files, ["file1.txt"])
         self.assertTrue(parsed_args.logging)
         self.assertEqual(parsed_args.root_folder, "output_dir")
+        self.assertFalse(parsed_args.watch)
+
+    def test_parse_arguments_watch(self):
+        """
+        Test that the watch mode options are parsed.
+        """
+        parsed_args = parse_arguments(
+            ["file1.txt", "--watch", "--poll-interval", "0.5", "--prune"]
+        )
+        self.assertTrue(parsed_args.watch)
+        self.assertEqual(parsed_args.poll_interval, 0.5)
+        self.assertTrue(parsed_args.prune)
+
+    def test_parse_arguments_sync(self):
+        """
+        Test that the sync mode options are parsed.
+        """
+        parsed_args = parse_arguments(
+            ["file1.txt", "--sync", "--dry-run", "--max-deletions", "10"]
+        )
+        self.assertTrue(parsed_args.sync)
+        self.assertTrue(parsed_args.dry_run)
+        self.assertEqual(parsed_args.max_deletions, 10)
+
+    def test_parse_arguments_metadata(self):
+        """
+        Test that the metadata defaults and the durability level are collected as
+        processor options.
+        """
+        parsed_args = parse_arguments(
+            [
+                "file1.txt",
+                "--dir-mode",
+                "755",
+                "--mtime",
+                "1700000000",
+                "--durability",
+                "dirs",
+            ]
+        )
+        self.assertEqual(
+            get_processor_options(parsed_args),
+            {"dir_mode": 0o755, "mtime": 1700000000.0, "durability": "dirs"},
+        )
+
+    def test_parse_arguments_resume(self):
+        """
+        Test that the resume options are only passed on when resuming.
+        """
+        parsed_args = parse_arguments(["file1.txt", "--checkpoint-interval", "50"])
+        self.assertEqual(get_processor_options(parsed_args), {})
+
+        parsed_args = parse_arguments(
+            ["file1.txt", "--resume", "--checkpoint-interval", "50"]
+        )
+        self.assertEqual(
+            get_processor_options(parsed_args),
+            {"resume": True, "checkpoint_interval": 50},
+        )
 
     def test_validate_files_valid(self):
         """
@@ -101,6 +170,162 @@ class TestMain(unittest.TestCase):
             Path("file1.txt")
         )
 
+    @patch("structra.main.SpecWatcher")
+    @patch("structra.main.StructureProcessor")
+    def test_watch_files(self, mock_processor, mock_watcher):
+        """
+        Test the watch_files function to ensure it starts a watcher for all files.
+        """
+        logger = MagicMock()
+        root_folder = Path(self.test_dir) / "output"
+        watch_files(["file1.txt"], logger, str(root_folder), 0.5, True)
+
+        mock_processor.assert_called_once_with(root_folder, logger)
+        mock_watcher.assert_called_once_with(
+            [Path("file1.txt")], mock_processor.return_value, logger, 0.5, True
+        )
+        mock_watcher.return_value.run.assert_called_once_with()
+
+    @patch("structra.main.StructureSyncer")
+    @patch("structra.main.StructureProcessor")
+    def test_sync_files(self, mock_processor, mock_syncer):
+        """
+        Test the sync_files function to ensure it prunes before creating entries.
+        """
+        logger = MagicMock()
+        root_folder = Path(self.test_dir) / "output"
+        mock_processor.return_value.load_pbs_file.return_value = ["entry"]
+        mock_syncer.return_value.stats.errors = 0
+
+        self.assertTrue(sync_files(["file1.txt"], logger, str(root_folder), False, 10))
+
+        mock_syncer.assert_called_once_with(root_folder, logger, 10)
+        mock_syncer.return_value.sync.assert_called_once_with(["entry"], False)
+        mock_processor.return_value.create_entries.assert_called_once_with(["entry"])
+
+    @patch("structra.main.StructureSyncer")
+    @patch("structra.main.StructureProcessor")
+    def test_sync_files_aborted(self, mock_processor, mock_syncer):
+        """
+        Test that an aborted sync creates nothing and reports the failure.
+        """
+        logger = MagicMock()
+        root_folder = Path(self.test_dir) / "output"
+        mock_syncer.return_value.sync.return_value = None
+
+        self.assertFalse(sync_files(["file1.txt"], logger, str(root_folder)))
+        mock_processor.return_value.create_entries.assert_not_called()
+
+    @patch("structra.main.StructureSyncer")
+    @patch("structra.main.StructureProcessor")
+    def test_sync_files_failed_removal(self, mock_processor, mock_syncer):
+        """
+        Test that a sync that could not remove every entry reports the failure.
+        """
+        logger = MagicMock()
+        root_folder = Path(self.test_dir) / "output"
+        mock_syncer.return_value.sync.return_value = 1
+        mock_syncer.return_value.stats.errors = 1
+
+        self.assertFalse(sync_files(["file1.txt"], logger, str(root_folder)))
+
+    @patch("structra.main.setup_logger")
+    def test_main_sync_exceeding_max_deletions_exits(self, mock_setup_logger):
+        """
+        Test that main exits with status 1 when the deletion limit stops a sync.
+        """
+        mock_setup_logger.return_value = MagicMock()
+        spec_file = Path(self.test_dir) / "spec.txt"
+        spec_file.write_text("project/\n└── keep.txt\n", encoding="utf-8")
+        output_dir = Path(self.test_dir) / "output"
+        for name in ("stray1", "stray2", "stray3"):
+            (output_dir / "project" / name).mkdir(parents=True)
+
+        with self.assertRaises(SystemExit) as context:
+            main(
+                [
+                    str(spec_file),
+                    "--sync",
+                    "--max-deletions",
+                    "1",
+                    "--root-folder",
+                    str(output_dir),
+                ]
+            )
+
+        self.assertEqual(context.exception.code, 1)
+        for name in ("stray1", "stray2", "stray3"):
+            self.assertTrue((output_dir / "project" / name).is_dir())
+        self.assertFalse((output_dir / "project/keep.txt").exists())
+
+    @patch("structra.main.StructureSyncer")
+    @patch("structra.main.StructureProcessor")
+    def test_sync_files_dry_run(self, mock_processor, mock_syncer):
+        """
+        Test that a dry run of sync_files creates nothing.
+        """
+        logger = MagicMock()
+        root_folder = Path(self.test_dir) / "output"
+
+        mock_syncer.return_value.stats.errors = 0
+
+        self.assertTrue(sync_files(["file1.txt"], logger, str(root_folder), True))
+
+        mock_processor.return_value.create_entries.assert_not_called()
+
+    def test_validate_files_stdin(self):
+        """
+        Test that "-" is accepted once as a placeholder for stdin.
+        """
+        logger = MagicMock()
+
+        self.assertTrue(validate_files(["-"], logger))
+        self.assertFalse(validate_files(["-", "-"], logger))
+
+    def test_check_files(self):
+        """
+        Test that check_files reports problems without creating anything.
+        """
+        spec_file = Path(self.test_dir) / "spec.txt"
+        spec_file.write_text("project/\n├── a.txt\n├── a.txt\n", encoding="utf-8")
+        logger = MagicMock()
+
+        self.assertFalse(check_files([str(spec_file)], logger))
+        logger.error.assert_called_once_with(
+            f"{spec_file}:3: Duplicate entry 'project/a.txt' (first declared on line 2)."
+        )
+        self.assertFalse((Path(self.test_dir) / "project").exists())
+
+    @patch("structra.main.ShardedGenerator")
+    @patch("structra.main.StructureProcessor")
+    def test_shard_files(self, mock_processor, mock_generator):
+        """
+        Test the shard_files function to ensure every file is generated in shards.
+        """
+        logger = MagicMock()
+        root_folder = Path(self.test_dir) / "output"
+        mock_processor.return_value.load_pbs_file.return_value = ["entry"]
+
+        shard_files(["file1.txt"], logger, str(root_folder), 4, 2)
+
+        mock_generator.assert_called_once_with(root_folder, logger, 4, 2, None)
+        mock_generator.return_value.generate.assert_called_once_with(["entry"])
+
+    @patch("structra.main.read_stdin")
+    @patch("structra.main.StructureProcessor")
+    def test_process_files_stdin(self, mock_processor, mock_read_stdin):
+        """
+        Test that "-" is processed as a stream from stdin.
+        """
+        logger = MagicMock()
+        root_folder = Path(self.test_dir) / "output"
+        process_files(["-"], logger, str(root_folder))
+
+        mock_processor.return_value.process_pbs_stream.assert_called_once_with(
+            mock_read_stdin.return_value
+        )
+        mock_processor.return_value.process_pbs_file.assert_not_called()
+
     @patch("structra.main.process_files")
     @patch("structra.main.validate_files")
     @patch("structra.main.setup_logger")
@@ -160,6 +385,44 @@ class TestMain(unittest.TestCase):
 
         mock_exit.assert_called_once_with(1)
 
+    @patch("structra.main.shard_files")
+    @patch("structra.main.validate_files")
+    @patch("structra.main.setup_logger")
+    def test_main_rejects_sharded_resume(
+        self, mock_setup_logger, mock_validate_files, mock_shard_files
+    ):
+        """
+        Test that main refuses to resume a sharded generation.
+        """
+        mock_setup_logger.return_value = MagicMock()
+        mock_validate_files.return_value = True
+
+        with self.assertRaises(SystemExit):
+            main(["file1.txt", "--workers", "2", "--resume"])
+
+        mock_shard_files.assert_not_called()
+
+    @patch("structra.main.sync_files")
+    @patch("structra.main.watch_files")
+    @patch("structra.main.validate_files")
+    @patch("structra.main.setup_logger")
+    def test_main_rejects_watch_and_sync_resume(
+        self, mock_setup_logger, mock_validate_files, mock_watch_files, mock_sync_files
+    ):
+        """
+        Test that main refuses to combine --resume with watch mode or a sync.
+        """
+        mock_setup_logger.return_value = MagicMock()
+        mock_validate_files.return_value = True
+
+        for option in ("--watch", "--sync"):
+            with self.assertRaises(SystemExit) as context:
+                main(["file1.txt", option, "--resume"])
+            self.assertEqual(context.exception.code, 1)
+
+        mock_watch_files.assert_not_called()
+        mock_sync_files.assert_not_called()
+
     @patch("structra.main.process_files")
     @patch("structra.main.validate_files")
     @patch("structra.main.setup_logger")
@@ -0,0 +1,130 @@
+# -----------------------------------------------------------------------------
+# Structra - A tool to generate folder and file structures based on input text files
+#
+# Copyright (c) 2024 Jonas Zeihe
+# Licensed under the MIT License. See LICENSE file in the project root for details.
+#
+# Project URL: https://github.com/jonaszeihe/structra
+# Contact: JonasZeihe@gmail.com
+# -----------------------------------------------------------------------------
+
+# test_sharding.py
+
+"""
+Unit tests for the sharded generation of the Structra application.
+
+These tests cover splitting a spec into subtrees, balancing them into shards and
+generating the shards in worker processes with merged statistics.
+
+Author: Jonas Zeihe
+"""
+
+import unittest
+import shutil
+import tempfile
+from pathlib import Path
+from unittest.mock import MagicMock
+from structra.sharding import ShardedGenerator, balance_subtrees, split_entries
+from structra.structure_processor import SpecEntry, StructureProcessor
+
+
+class TestSharding(unittest.TestCase):
+    """
+    Tests to ensure a spec is split, balanced and generated in parallel.
+    """
+
+    def setUp(self):
+        """
+        Set up a temporary output directory and a parsed spec.
+        """
+        self.test_dir = Path(tempfile.mkdtemp())
+        self.logger = MagicMock()
+        self.entries = StructureProcessor(self.test_dir, self.logger).parse_pbs_lines(
+            [
+                "project/",
+                "├── big/",
+                "│   ├── a.txt",
+                "│   ├── b.txt",
+                "│   └── nested/",
+                "│       └── c.txt",
+                "├── small/",
+                "│   └── d.txt",
+                "├── tiny/",
+                "└── README.md",
+            ]
+        )
+
+    def tearDown(self):
+        """
+        Clean up the temporary directory.
+        """
+        shutil.rmtree(self.test_dir)
+
+    def test_split_entries(self):
+        """
+        Test that entries are split into shared ancestors and subtrees.
+        """
+        shared, subtrees = split_entries(self.entries)
+
+        self.assertEqual(shared, [SpecEntry("project", True)])
+        self.assertEqual(
+            [[entry.path for entry in subtree] for subtree in subtrees],
+            [
+                [
+                    "project/big",
+                    "project/big/a.txt",
+                    "project/big/b.txt",
+                    "project/big/nested",
+                    "project/big/nested/c.txt",
+                ],
+                ["project/small", "project/small/d.txt"],
+                ["project/tiny"],
+                ["project/README.md"],
+            ],
+        )
+
+    def test_split_entries_deeper(self):
+        """
+        Test that a deeper split shares the directories above it.
+        """
+        shared, subtrees = split_entries(self.entries, depth=2)
+
+        self.assertEqual(
+            [entry.path for entry in shared],
+            [
+                "project",
+                "project/big",
+                "project/small",
+                "project/tiny",
+                "project/README.md",
+            ],
+        )
+        self.assertEqual(len(subtrees), 4)
+
+    def test_balance_subtrees(self):
+        """
+        Test that subtrees are packed into shards of similar size.
+        """
+        _, subtrees = split_entries(self.entries)
+
+        shards = balance_subtrees(subtrees, 2)
+
+        self.assertEqual(sorted(len(shard) for shard in shards), [4, 5])
+        self.assertEqual(len(balance_subtrees(subtrees, 10)), 4)
+
+    def test_generate(self):
+        """
+        Test that the shards are generated by worker processes and the stats merged.
+        """
+        generator = ShardedGenerator(self.test_dir, self.logger, workers=2)
+
+        stats = generator.generate(self.entries)
+
+        for entry in self.entries:
+            self.assertEqual((self.test_dir / entry.path).is_dir(), entry.is_dir)
+            self.assertTrue((self.test_dir / entry.path).exists())
+        self.assertEqual((stats.directories, stats.files, stats.errors), (5, 5, 0))
+
+
+if __name__ == "__main__":
+    unittest.main()
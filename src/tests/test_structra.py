@@ -25,7 +25,13 @@ import tempfile
 from pathlib import Path
 import os
 import stat
-from structra.structure_processor import StructureProcessor
+from unittest.mock import patch
+from structra.structure_processor import (
+    SpecEntry,
+    StructureProcessor,
+    parse_mode,
+    parse_timestamp,
+)
 from structra.logger_config import setup_logger
 
 
@@ -142,6 +148,176 @@ class TestStructra(unittest.TestCase):
         result = processor._count_hierarchy_level("│       ├── main.py")
         self.assertEqual(result, 2)
 
+    def test_parse_pbs_lines(self):
+        """
+        Unit test for the parse_pbs_lines method in StructureProcessor.
+        """
+        processor = StructureProcessor(Path(self.test_dir), self.logger)
+        entries = processor.parse_pbs_lines(
+            ["root/\n", "├── src/\n", "│   └── main.py\n", "\n", "└── README.md\n"]
+        )
+        self.assertEqual(
+            entries,
+            [
+                SpecEntry("root", True),
+                SpecEntry("root/src", True),
+                SpecEntry("root/src/main.py", False),
+                SpecEntry("root/README.md", False),
+            ],
+        )
+        self.assertEqual([entry.line_number for entry in entries], [1, 2, 3, 5])
+
+    def test_parse_metadata(self):
+        """
+        Unit test for metadata blocks at the end of PBS lines.
+        """
+        processor = StructureProcessor(Path(self.test_dir), self.logger)
+        entries = processor.parse_pbs_lines(
+            [
+                "root/ {mode=750}",
+                "├── run.sh {mode=755, mtime=1700000000}",
+                "└── notes {draft}.txt",
+            ]
+        )
+        self.assertEqual(entries[0], SpecEntry("root", True, mode=0o750))
+        self.assertEqual(
+            entries[1],
+            SpecEntry("root/run.sh", False, mode=0o755, mtime=1700000000.0),
+        )
+        self.assertEqual(entries[2].path, "root/notes {draft}.txt")
+
+    def test_parse_braces_in_names(self):
+        """
+        Unit test that trailing braces without mode/mtime pairs stay part of the name.
+        """
+        processor = StructureProcessor(Path(self.test_dir), self.logger)
+        with self.assertNoLogs(self.logger, level="ERROR"):
+            entries = processor.parse_pbs_lines(
+                [
+                    "root/",
+                    "├── notes {draft}",
+                    "├── Component {8F2A-11}/",
+                    "├── empty {}",
+                    "└── mixed {mode=644 owner=root}",
+                ]
+            )
+        self.assertEqual(
+            entries[1:],
+            [
+                SpecEntry("root/notes {draft}", False),
+                SpecEntry("root/Component {8F2A-11}", True),
+                SpecEntry("root/empty {}", False),
+                SpecEntry("root/mixed {mode=644 owner=root}", False),
+            ],
+        )
+
+    def test_parse_mode_and_timestamp(self):
+        """
+        Unit test for the parse_mode and parse_timestamp helpers.
+        """
+        self.assertEqual(parse_mode("644"), 0o644)
+        self.assertEqual(parse_mode("0o755"), 0o755)
+        self.assertRaises(ValueError, parse_mode, "999")
+        self.assertEqual(parse_timestamp("1700000000"), 1700000000.0)
+        self.assertEqual(parse_timestamp("2024-01-01T00:00:00+00:00"), 1704067200.0)
+
+    @unittest.skipIf(os.name == "nt", "POSIX permission bits required")
+    def test_create_entries_applies_metadata(self):
+        """
+        Test that modes and timestamps are applied in the creation pass.
+        """
+        processor = StructureProcessor(
+            Path(self.test_dir), self.logger, file_mode=0o600, mtime=1600000000
+        )
+        processor.create_entries(
+            [
+                SpecEntry("root", True, mode=0o555, mtime=1700000000),
+                SpecEntry("root/a.txt", False),
+                SpecEntry("root/b.sh", False, mode=0o755),
+            ]
+        )
+        root = Path(self.test_dir) / "root"
+        try:
+            self.assertEqual(stat.S_IMODE(root.stat().st_mode), 0o555)
+            self.assertEqual(root.stat().st_mtime, 1700000000)
+            self.assertEqual(stat.S_IMODE((root / "a.txt").stat().st_mode), 0o600)
+            self.assertEqual((root / "a.txt").stat().st_mtime, 1600000000)
+            self.assertEqual(stat.S_IMODE((root / "b.sh").stat().st_mode), 0o755)
+        finally:
+            os.chmod(root, 0o755)
+
+    def test_process_pbs_stream_is_incremental(self):
+        """
+        Test that entries from a stream are created before the stream is exhausted.
+        """
+        processor = StructureProcessor(Path(self.test_dir), self.logger)
+        src_path = Path(self.test_dir) / "root/src"
+        seen_before_end = []
+
+        def producer():
+            yield "root/\n"
+            yield "├── src/\n"
+            yield "│   └── main.py\n"
+            seen_before_end.append(src_path.is_dir())
+            yield "└── README.md\n"
+
+        processor.process_pbs_stream(producer())
+
+        self.assertEqual(seen_before_end, [True])
+        self.assertTrue((Path(self.test_dir) / "root/README.md").exists())
+
+    @unittest.skipUnless(hasattr(os, "sync"), "os.sync required")
+    @patch("structra.structure_processor.os.sync")
+    def test_durability_end(self, mock_sync):
+        """
+        Test that durability level "end" syncs once after all entries are created.
+        """
+        processor = StructureProcessor(
+            Path(self.test_dir), self.logger, durability="end"
+        )
+        processor.create_entries(
+            [SpecEntry("root", True), SpecEntry("root/a.txt", False)]
+        )
+        mock_sync.assert_called_once_with()
+
+    @unittest.skipIf(os.name == "nt", "directory fsync required")
+    @patch("structra.structure_processor.os.fsync")
+    def test_durability_dirs(self, mock_fsync):
+        """
+        Test that durability level "dirs" fsyncs every created directory.
+        """
+        processor = StructureProcessor(
+            Path(self.test_dir), self.logger, durability="dirs"
+        )
+        processor.create_entries(
+            [
+                SpecEntry("root", True),
+                SpecEntry("root/src", True),
+                SpecEntry("root/src/a.txt", False),
+            ]
+        )
+        self.assertEqual(mock_fsync.call_count, 3)
+
+    def test_invalid_durability(self):
+        """
+        Test that an unknown durability level is rejected.
+        """
+        with self.assertRaises(ValueError):
+            StructureProcessor(Path(self.test_dir), self.logger, durability="always")
+
+    def test_remove_entries(self):
+        """
+        Unit test for the remove_entries method in StructureProcessor.
+        """
+        processor = StructureProcessor(Path(self.test_dir), self.logger)
+        processor.create_entries(
+            [SpecEntry("root", True), SpecEntry("root/a.txt", False)]
+        )
+        processor.remove_entries(
+            [SpecEntry("root", True), SpecEntry("root/a.txt", False)]
+        )
+        self.assertFalse((Path(self.test_dir) / "root").exists())
+
     def test_create_directory(self):
         """
         Unit test for the _create_directory method in StructureProcessor.
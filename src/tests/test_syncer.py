@@ -0,0 +1,140 @@
+# -----------------------------------------------------------------------------
+# Structra - A tool to generate folder and file structures based on input text files
+#
+# Copyright (c) 2024 Jonas Zeihe
+# Licensed under the MIT License. See LICENSE file in the project root for details.
+#
+# Project URL: https://github.com/jonaszeihe/structra
+# Contact: JonasZeihe@gmail.com
+# -----------------------------------------------------------------------------
+
+# test_syncer.py
+
+"""
+Unit tests for the sync mode of the Structra application.
+
+These tests cover the detection of entries absent from a spec and their removal,
+including the dry run and the deletion limit.
+
+Author: Jonas Zeihe
+"""
+
+import unittest
+import shutil
+import tempfile
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+from structra.structure_processor import StructureProcessor
+from structra.syncer import StructureSyncer
+
+
+class TestSyncer(unittest.TestCase):
+    """
+    Tests to ensure drifted entries are found and pruned.
+    """
+
+    def setUp(self):
+        """
+        Set up a generated structure with some entries that are not in the spec.
+        """
+        self.test_dir = Path(tempfile.mkdtemp())
+        self.logger = MagicMock()
+        processor = StructureProcessor(self.test_dir, self.logger)
+        self.entries = processor.parse_pbs_lines(
+            ["project/", "├── src/", "│   └── main.py", "└── README.md"]
+        )
+        processor.create_entries(self.entries)
+
+        (self.test_dir / "project/stale.txt").touch()
+        (self.test_dir / "project/old/deep").mkdir(parents=True)
+        (self.test_dir / "project/old/deep/file.txt").touch()
+        (self.test_dir / "unrelated.txt").touch()
+
+    def tearDown(self):
+        """
+        Clean up the temporary directory.
+        """
+        shutil.rmtree(self.test_dir)
+
+    def test_find_drift(self):
+        """
+        Test that absent entries are reported once per subtree and counted fully.
+        """
+        syncer = StructureSyncer(self.test_dir, self.logger)
+
+        drift, deletions = syncer.find_drift(self.entries)
+
+        self.assertEqual(
+            sorted(entry.path for entry in drift), ["project/old", "project/stale.txt"]
+        )
+        self.assertEqual(deletions, 4)
+
+    def test_sync_removes_drift(self):
+        """
+        Test that sync removes absent entries and keeps declared ones.
+        """
+        syncer = StructureSyncer(self.test_dir, self.logger, batch_size=1)
+
+        self.assertEqual(syncer.sync(self.entries), 2)
+        self.assertFalse((self.test_dir / "project/stale.txt").exists())
+        self.assertFalse((self.test_dir / "project/old").exists())
+        self.assertTrue((self.test_dir / "project/src/main.py").exists())
+        self.assertTrue((self.test_dir / "unrelated.txt").exists())
+
+    def test_sync_replaces_type_mismatch(self):
+        """
+        Test that a directory declared as a file is treated as drift.
+        """
+        (self.test_dir / "project/README.md").unlink()
+        (self.test_dir / "project/README.md").mkdir()
+        syncer = StructureSyncer(self.test_dir, self.logger)
+
+        syncer.sync(self.entries)
+
+        self.assertFalse((self.test_dir / "project/README.md").exists())
+
+    def test_dry_run_removes_nothing(self):
+        """
+        Test that a dry run only lists the drifted entries.
+        """
+        syncer = StructureSyncer(self.test_dir, self.logger)
+
+        self.assertEqual(syncer.sync(self.entries, dry_run=True), 2)
+        self.assertTrue((self.test_dir / "project/stale.txt").exists())
+        self.assertTrue((self.test_dir / "project/old/deep/file.txt").exists())
+
+    def test_max_deletions_aborts_sync(self):
+        """
+        Test that the sync is refused if it would exceed the deletion limit.
+        """
+        syncer = StructureSyncer(self.test_dir, self.logger, max_deletions=3)
+
+        self.assertIsNone(syncer.sync(self.entries))
+        self.assertTrue((self.test_dir / "project/old/deep/file.txt").exists())
+        self.logger.error.assert_called_once()
+
+    def test_dry_run_warns_about_max_deletions(self):
+        """
+        Test that a dry run warns when the real sync would exceed the deletion limit.
+        """
+        syncer = StructureSyncer(self.test_dir, self.logger, max_deletions=3)
+
+        self.assertEqual(syncer.sync(self.entries, dry_run=True), 2)
+        self.logger.warning.assert_called_once()
+        self.logger.error.assert_not_called()
+
+    @patch("structra.syncer.shutil.rmtree", side_effect=PermissionError("denied"))
+    def test_failed_removals_are_counted(self, mock_rmtree):
+        """
+        Test that entries that cannot be removed are counted as errors.
+        """
+        syncer = StructureSyncer(self.test_dir, self.logger)
+
+        self.assertEqual(syncer.sync(self.entries), 1)
+        self.assertEqual((syncer.stats.removed, syncer.stats.errors), (1, 1))
+        self.assertFalse((self.test_dir / "project/stale.txt").exists())
+        self.assertTrue((self.test_dir / "project/old").exists())
+
+
+if __name__ == "__main__":
+    unittest.main()
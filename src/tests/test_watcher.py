@@ -0,0 +1,207 @@
+# -----------------------------------------------------------------------------
+# Structra - A tool to generate folder and file structures based on input text files
+#
+# Copyright (c) 2024 Jonas Zeihe
+# Licensed under the MIT License. See LICENSE file in the project root for details.
+#
+# Project URL: https://github.com/jonaszeihe/structra
+# Contact: JonasZeihe@gmail.com
+# -----------------------------------------------------------------------------
+
+# test_watcher.py
+
+"""
+Unit tests for the watch mode of the Structra application.
+
+These tests cover the diffing of parsed specs and the incremental re-application
+of changed PBS files to the output directory.
+
+Author: Jonas Zeihe
+"""
+
+import unittest
+import os
+import shutil
+import tempfile
+from pathlib import Path
+from unittest.mock import MagicMock
+from structra.structure_processor import SpecEntry, StructureProcessor
+from structra.watcher import SpecWatcher, diff_entries
+
+
+class TestWatcher(unittest.TestCase):
+    """
+    Tests to ensure watched PBS files are re-applied incrementally.
+    """
+
+    def setUp(self):
+        """
+        Set up a temporary directory with a PBS file and an output directory.
+        """
+        self.test_dir = tempfile.mkdtemp()
+        self.output_dir = Path(self.test_dir) / "output"
+        self.spec_file = Path(self.test_dir) / "spec.txt"
+        self._write_spec("project/\n├── src/\n│   └── main.py\n└── README.md\n")
+
+        self.logger = MagicMock()
+        self.processor = StructureProcessor(self.output_dir, self.logger)
+
+    def tearDown(self):
+        """
+        Clean up the temporary directory.
+        """
+        shutil.rmtree(self.test_dir)
+
+    def _write_spec(self, content):
+        """
+        Writes the PBS file and bumps its modification time so the change is detected.
+        """
+        self.spec_file.write_text(content, encoding="utf-8")
+        stat_result = self.spec_file.stat()
+        os.utime(
+            self.spec_file,
+            ns=(stat_result.st_atime_ns, stat_result.st_mtime_ns + 1_000_000_000),
+        )
+
+    def test_diff_entries(self):
+        """
+        Test that diff_entries reports added and removed entries.
+        """
+        old = [SpecEntry("p", True), SpecEntry("p/a.txt", False)]
+        new = [SpecEntry("p", True), SpecEntry("p/b.txt", False)]
+
+        added, removed = diff_entries(old, new)
+
+        self.assertEqual(added, [SpecEntry("p/b.txt", False)])
+        self.assertEqual(removed, [SpecEntry("p/a.txt", False)])
+
+    def test_diff_entries_metadata_change(self):
+        """
+        Test that a metadata change is re-applied without removing the entry.
+        """
+        old = [SpecEntry("p/a.txt", False)]
+        new = [SpecEntry("p/a.txt", False, mode=0o600)]
+
+        added, removed = diff_entries(old, new)
+
+        self.assertEqual(added, new)
+        self.assertEqual(removed, [])
+
+    def test_initial_poll_creates_structure(self):
+        """
+        Test that the first poll generates the whole structure.
+        """
+        watcher = SpecWatcher([self.spec_file], self.processor, self.logger)
+
+        self.assertEqual(watcher.poll(), 1)
+        self.assertTrue((self.output_dir / "project/src/main.py").is_file())
+        self.assertTrue((self.output_dir / "project/README.md").is_file())
+
+    def test_unchanged_spec_is_skipped(self):
+        """
+        Test that an unchanged spec does not trigger any work.
+        """
+        watcher = SpecWatcher([self.spec_file], self.processor, self.logger)
+        watcher.poll()
+
+        self.assertEqual(watcher.poll(), 0)
+
+    def test_touched_spec_with_same_content_is_skipped(self):
+        """
+        Test that a new modification time without new content is not re-applied.
+        """
+        watcher = SpecWatcher([self.spec_file], self.processor, self.logger)
+        watcher.poll()
+        self._write_spec(self.spec_file.read_text(encoding="utf-8"))
+
+        self.assertEqual(watcher.poll(), 0)
+
+    def test_added_entries_are_created(self):
+        """
+        Test that only added entries are created after a change.
+        """
+        watcher = SpecWatcher([self.spec_file], self.processor, self.logger)
+        watcher.poll()
+        self.processor.create_entries = MagicMock()
+
+        self._write_spec(
+            "project/\n├── src/\n│   ├── main.py\n│   └── util.py\n└── README.md\n"
+        )
+
+        self.assertEqual(watcher.poll(), 1)
+        self.processor.create_entries.assert_called_once_with(
+            [SpecEntry("project/src/util.py", False)]
+        )
+
+    def test_removed_entries_are_kept_without_prune(self):
+        """
+        Test that removed entries stay on disk unless pruning is enabled.
+        """
+        watcher = SpecWatcher([self.spec_file], self.processor, self.logger)
+        watcher.poll()
+
+        self._write_spec("project/\n└── README.md\n")
+        watcher.poll()
+
+        self.assertTrue((self.output_dir / "project/src/main.py").exists())
+
+    def test_removed_entries_are_pruned(self):
+        """
+        Test that removed entries are deleted when pruning is enabled.
+        """
+        watcher = SpecWatcher([self.spec_file], self.processor, self.logger, prune=True)
+        watcher.poll()
+
+        self._write_spec("project/\n└── README.md\n")
+        self.assertEqual(watcher.poll(), 0)
+        self.assertTrue((self.output_dir / "project/src").exists())
+
+        self.assertEqual(watcher.poll(), 1)
+        self.assertFalse((self.output_dir / "project/src").exists())
+        self.assertTrue((self.output_dir / "project/README.md").exists())
+
+    def test_partial_read_is_not_pruned(self):
+        """
+        Test that content seen only once does not remove anything when pruning.
+        """
+        watcher = SpecWatcher([self.spec_file], self.processor, self.logger, prune=True)
+        watcher.poll()
+
+        self._write_spec("project/\n")
+        watcher.poll()
+        self._write_spec("project/\n├── src/\n│   └── main.py\n└── README.md\n")
+        watcher.poll()
+
+        self.assertTrue((self.output_dir / "project/src/main.py").exists())
+        self.assertTrue((self.output_dir / "project/README.md").exists())
+
+    def test_invalid_utf8_is_retried(self):
+        """
+        Test that an undecodable spec is logged and retried instead of stopping.
+        """
+        self.spec_file.write_bytes(b"proj/\n\xff\xfe bad\n")
+        watcher = SpecWatcher([self.spec_file], self.processor, self.logger)
+
+        self.assertEqual(watcher.poll(), 0)
+        self.logger.error.assert_called_once()
+
+        self.spec_file.write_text("proj/\n└── good.txt\n", encoding="utf-8")
+        self.assertEqual(watcher.poll(), 1)
+        self.assertTrue((self.output_dir / "proj/good.txt").is_file())
+
+    def test_run_stops_after_max_polls(self):
+        """
+        Test that run stops after the requested number of polls.
+        """
+        watcher = SpecWatcher(
+            [self.spec_file], self.processor, self.logger, poll_interval=0
+        )
+        watcher.poll = MagicMock()
+
+        watcher.run(max_polls=3)
+
+        self.assertEqual(watcher.poll.call_count, 3)
+
+
+if __name__ == "__main__":
+    unittest.main()